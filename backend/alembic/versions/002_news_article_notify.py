@@ -0,0 +1,43 @@
+"""notify new articles
+
+Revision ID: 002_news_article_notify
+Revises: 001_initial_schema
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+
+
+revision = "002_news_article_notify"
+down_revision = "001_initial_schema"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # SSE 推送通过 LISTEN new_article 订阅，插入新文章时触发通知
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION notify_new_article() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify(
+                'new_article',
+                NEW.id::text || '|' || extract(epoch from NEW.collected_at)::text
+            );
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_news_articles_notify
+        AFTER INSERT ON news_articles
+        FOR EACH ROW EXECUTE FUNCTION notify_new_article();
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_news_articles_notify ON news_articles")
+    op.execute("DROP FUNCTION IF EXISTS notify_new_article()")
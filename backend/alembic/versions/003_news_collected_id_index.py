@@ -0,0 +1,29 @@
+"""collected_at/id keyset index for SSE cursor
+
+Revision ID: 003_news_collected_id_index
+Revises: 002_news_article_notify
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "003_news_collected_id_index"
+down_revision = "002_news_article_notify"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # (collected_at, id) > (:ts, :id) 行比较可直接走此索引的范围扫描
+    op.create_index(
+        "idx_news_collected_id",
+        "news_articles",
+        ["collected_at", "id"],
+        postgresql_where=sa.text("NOT is_filtered"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_news_collected_id", table_name="news_articles")
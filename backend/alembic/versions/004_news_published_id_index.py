@@ -0,0 +1,29 @@
+"""published_at/id keyset index for /news pagination
+
+Revision ID: 004_news_published_id_index
+Revises: 003_news_collected_id_index
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "004_news_published_id_index"
+down_revision = "003_news_collected_id_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # ORDER BY published_at DESC, id DESC 通过反向扫描此索引完成
+    op.create_index(
+        "idx_news_published_id",
+        "news_articles",
+        ["published_at", "id"],
+        postgresql_where=sa.text("NOT is_filtered"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_news_published_id", table_name="news_articles")
@@ -0,0 +1,32 @@
+"""pg_trgm GIN index for title search
+
+Revision ID: 005_news_title_trgm_index
+Revises: 004_news_published_id_index
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "005_news_title_trgm_index"
+down_revision = "004_news_published_id_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # title ILIKE '%q%' 由 trigram 索引加速（q 至少 3 个字符时生效）
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "idx_news_title_trgm",
+        "news_articles",
+        ["title"],
+        postgresql_using="gin",
+        postgresql_ops={"title": "gin_trgm_ops"},
+        postgresql_where=sa.text("NOT is_filtered"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_news_title_trgm", table_name="news_articles")
@@ -0,0 +1,24 @@
+"""drop redundant content_hash index
+
+Revision ID: 006_drop_content_hash_index
+Revises: 005_news_title_trgm_index
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+
+
+revision = "006_drop_content_hash_index"
+down_revision = "005_news_title_trgm_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # uq_news_articles_content_hash 已自带同列 btree 索引，
+    # 该普通索引只会让每次 INSERT 多维护一棵树
+    op.drop_index("idx_news_content_hash", table_name="news_articles")
+
+
+def downgrade() -> None:
+    op.create_index("idx_news_content_hash", "news_articles", ["content_hash"])
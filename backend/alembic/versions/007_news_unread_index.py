@@ -0,0 +1,29 @@
+"""partial index over unread articles
+
+Revision ID: 007_news_unread_index
+Revises: 006_drop_content_hash_index
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "007_news_unread_index"
+down_revision = "006_drop_content_hash_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # mark-all-read 只需定位未读行；已读行不进索引，全部标记后索引近乎为空
+    op.create_index(
+        "idx_news_unread",
+        "news_articles",
+        ["source"],
+        postgresql_where=sa.text("NOT is_read"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_news_unread", table_name="news_articles")
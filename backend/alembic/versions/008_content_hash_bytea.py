@@ -0,0 +1,38 @@
+"""store content_hash as raw bytea
+
+Revision ID: 008_content_hash_bytea
+Revises: 007_news_unread_index
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "008_content_hash_bytea"
+down_revision = "007_news_unread_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 十六进制串 → 32 字节原值；uq_news_articles_content_hash 随类型变更自动重建
+    op.alter_column(
+        "news_articles",
+        "content_hash",
+        type_=sa.LargeBinary(),
+        existing_type=sa.String(length=64),
+        existing_nullable=False,
+        postgresql_using="decode(content_hash, 'hex')",
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "news_articles",
+        "content_hash",
+        type_=sa.String(length=64),
+        existing_type=sa.LargeBinary(),
+        existing_nullable=False,
+        postgresql_using="encode(content_hash, 'hex')",
+    )
@@ -0,0 +1,39 @@
+"""cover list filters in the published_at/id keyset index
+
+Revision ID: 009_news_published_id_covering
+Revises: 008_content_hash_bytea
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "009_news_published_id_covering"
+down_revision = "008_content_hash_bytea"
+branch_labels = None
+depends_on = None
+
+_INCLUDE = ["source", "source_category", "is_read", "is_starred", "collected_at"]
+
+
+def upgrade() -> None:
+    # /news 先在索引上定位本页 id 并计数，过滤列随索引携带即可 index-only scan
+    op.drop_index("idx_news_published_id", table_name="news_articles")
+    op.create_index(
+        "idx_news_published_id",
+        "news_articles",
+        ["published_at", "id"],
+        postgresql_include=_INCLUDE,
+        postgresql_where=sa.text("NOT is_filtered"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_news_published_id", table_name="news_articles")
+    op.create_index(
+        "idx_news_published_id",
+        "news_articles",
+        ["published_at", "id"],
+        postgresql_where=sa.text("NOT is_filtered"),
+    )
@@ -0,0 +1,38 @@
+"""partial indexes for source-filtered and starred /news lists
+
+Revision ID: 010_news_list_partial_indexes
+Revises: 009_news_published_id_covering
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "010_news_list_partial_indexes"
+down_revision = "009_news_published_id_covering"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 按来源筛选时直接从该来源的 (published_at, id) 有序段取本页，
+    # 不必在全表的 idx_news_published_id 上逐行过滤 source
+    op.create_index(
+        "idx_news_source_published_id",
+        "news_articles",
+        ["source", "published_at", "id"],
+        postgresql_where=sa.text("NOT is_filtered"),
+    )
+    # 收藏只占极少数行，单独的部分索引很小，starred_only 列表不再扫描全部未过滤行
+    op.create_index(
+        "idx_news_starred_published_id",
+        "news_articles",
+        ["published_at", "id"],
+        postgresql_where=sa.text("is_starred AND NOT is_filtered"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_news_starred_published_id", table_name="news_articles")
+    op.drop_index("idx_news_source_published_id", table_name="news_articles")
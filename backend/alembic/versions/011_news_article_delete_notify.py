@@ -0,0 +1,42 @@
+"""notify on article deletes
+
+Revision ID: 011_news_article_delete_notify
+Revises: 010_news_list_partial_indexes
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+
+
+revision = "011_news_article_delete_notify"
+down_revision = "010_news_list_partial_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 清理任务按批删除文章后，各进程的来源/分类计数和列表总数缓存需要失效。
+    # 语句级触发器：每条 DELETE（每个清理批次）只发一次通知，与删除行数无关。
+    # 复用 new_article 频道，现有订阅者都只做缓存失效或唤醒，不解析 payload
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION notify_deleted_articles() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('new_article', 'deleted');
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_news_articles_delete_notify
+        AFTER DELETE ON news_articles
+        FOR EACH STATEMENT EXECUTE FUNCTION notify_deleted_articles();
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_news_articles_delete_notify ON news_articles")
+    op.execute("DROP FUNCTION IF EXISTS notify_deleted_articles()")
@@ -15,8 +15,9 @@ from app.api.stream import router as stream_router
 router = APIRouter()
 
 # 注册所有路由
+# stream 必须先于 news 注册，否则 /news/stream 会被 /news/{article_id} 匹配
+router.include_router(stream_router)
 router.include_router(news_router)
 router.include_router(stats_router)
 router.include_router(cleanup_router)
 router.include_router(collection_router)
-router.include_router(stream_router)
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, Query
+from pydantic import TypeAdapter
 
 from app.api.deps import get_cleanup_service
 from app.schemas.cleanup import CleanupLogResponse, CleanupStatsResponse
@@ -6,6 +7,9 @@ from app.services import CleanupService
 
 router = APIRouter(tags=["cleanup"])
 
+# 整个列表一次校验，避免逐行 model_validate
+_cleanup_logs_adapter = TypeAdapter(list[CleanupLogResponse])
+
 
 @router.get("/cleanup-logs", response_model=list[CleanupLogResponse])
 async def get_cleanup_logs(
@@ -13,7 +17,7 @@ async def get_cleanup_logs(
     service: CleanupService = Depends(get_cleanup_service),
 ):
     logs = await service.get_cleanup_logs(limit)
-    return [CleanupLogResponse.model_validate(log) for log in logs]
+    return _cleanup_logs_adapter.validate_python(logs, from_attributes=True)
 
 
 @router.get("/cleanup-stats", response_model=CleanupStatsResponse)
@@ -6,7 +6,7 @@ API Dependencies - 依赖注入工厂
 - 提供服务实例
 """
 
-from fastapi import Depends
+from fastapi import Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db, async_session_maker
@@ -32,12 +32,13 @@ async def get_stats_service(db: AsyncSession = Depends(get_db)) -> StatsService:
 async def get_cleanup_service(db: AsyncSession = Depends(get_db)) -> CleanupService:
     return CleanupService(db)
 
+
 async def get_collection_service(
     db: AsyncSession = Depends(get_db),
 ) -> CollectionService:
     return CollectionService(db, log_session_maker=async_session_maker)
 
 
-def get_stream_service() -> StreamService:
-    """获取流服务实例"""
-    return StreamService(async_session_maker)
+async def get_stream_service(request: Request) -> StreamService:
+    """获取流服务实例（应用级单例，在 lifespan 中创建）"""
+    return request.app.state.stream_service
@@ -11,19 +11,25 @@ from datetime import date
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import TypeAdapter
 
 from app.api.deps import get_news_service
 from app.config import settings
 from app.middleware.auth import require_api_key
 from app.schemas.news import (
+    NewsArticleListResponse,
     NewsArticleResponse,
     NewsArticleUpdate,
     PaginatedNews,
 )
 from app.services import NewsService
+from app.utils.pagination import decode_cursor, encode_cursor
 
 router = APIRouter(prefix="/news", tags=["news"])
 
+# 整页文章一次校验，避免逐行 model_validate
+_articles_adapter = TypeAdapter(list[NewsArticleListResponse])
+
 
 @router.get("", response_model=PaginatedNews)
 async def get_news(
@@ -35,13 +41,28 @@ async def get_news(
     published_date: date | None = Query(default=None),
     starred_only: bool = False,
     unread_only: bool = False,
+    cursor: str | None = Query(default=None),
+    include_total: bool = True,
     service: NewsService = Depends(get_news_service),
 ):
-    """Get paginated news list with filtering."""
+    """Get paginated news list with filtering.
+
+    Pass ``next_cursor`` from the previous response as ``cursor`` for
+    keyset pagination; ``page`` is ignored when a cursor is given.
+    Cursor pages never run a COUNT: ``total``/``pages`` are filled from
+    the per-filter total cached by an earlier offset page, else null.
+    """
     if per_page is None:
         per_page = settings.DEFAULT_PAGE_SIZE
 
-    articles, total = await service.get_paginated_news(
+    decoded_cursor = None
+    if cursor:
+        try:
+            decoded_cursor = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    articles, total, next_cursor = await service.get_paginated_news(
         page=page,
         per_page=per_page,
         source=source,
@@ -50,14 +71,21 @@ async def get_news(
         published_date=published_date,
         starred_only=starred_only,
         unread_only=unread_only,
+        cursor=decoded_cursor,
+        include_total=include_total,
     )
 
+    pages = None
+    if total is not None:
+        pages = (total + per_page - 1) // per_page if total > 0 else 0
+
     return PaginatedNews(
-        items=[NewsArticleResponse.model_validate(item) for item in articles],
+        items=_articles_adapter.validate_python(articles, from_attributes=True),
         total=total,
         page=page,
         per_page=per_page,
-        pages=(total + per_page - 1) // per_page if total > 0 else 0,
+        pages=pages,
+        next_cursor=encode_cursor(*next_cursor) if next_cursor else None,
     )
 
 
@@ -9,6 +9,7 @@ Stats Routes - 统计相关API路由
 """
 
 from fastapi import APIRouter, Depends, Query
+from pydantic import TypeAdapter
 
 from app.api.deps import get_stats_service
 from app.schemas.news import CollectionLogResponse
@@ -16,6 +17,9 @@ from app.services import StatsService
 
 router = APIRouter(tags=["stats"])
 
+# 整个列表一次校验，避免逐行 model_validate
+_collection_logs_adapter = TypeAdapter(list[CollectionLogResponse])
+
 
 @router.get("/sources")
 async def get_sources(
@@ -48,4 +52,4 @@ async def get_collection_logs(
 ):
     """Get recent collection logs."""
     logs = await service.get_collection_logs(limit)
-    return [CollectionLogResponse.model_validate(log) for log in logs]
+    return _collection_logs_adapter.validate_python(logs, from_attributes=True)
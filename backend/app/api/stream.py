@@ -5,32 +5,52 @@ Stream Routes - SSE实时推送路由
 - SSE新闻流端点
 """
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header
 from fastapi.responses import StreamingResponse
 
 from app.api.deps import get_stream_service
 from app.services import StreamService
-from app.schemas.news import NewsArticleResponse
+from app.utils.pagination import decode_cursor, encode_cursor
 
 router = APIRouter(tags=["stream"])
 
+# 心跳注释行，防止代理在空闲期断开连接
+KEEPALIVE_COMMENT = b": keep-alive\n\n"
+
 
 @router.get("/news/stream")
 async def news_stream(
+    last_event_id: str | None = Header(default=None),
     service: StreamService = Depends(get_stream_service),
 ):
-    """SSE endpoint for real-time news updates."""
+    """SSE endpoint for real-time news updates.
+
+    Each event carries an ``id`` cursor; on reconnect the browser sends it
+    back as ``Last-Event-ID`` and the stream resumes right after it.
+    """
+    resume_cursor = None
+    if last_event_id:
+        try:
+            resume_cursor = decode_cursor(last_event_id)
+        except ValueError:
+            resume_cursor = None
 
     async def sse_generator():
-        async for article in service.news_article_generator():
-            data = NewsArticleResponse.model_validate(article).model_dump_json()
-            yield f"data: {data}\n\n"
+        async for row in service.news_article_generator(resume_cursor=resume_cursor):
+            if row is None:
+                yield KEEPALIVE_COMMENT
+                continue
+            collected_at, article_id, payload = row
+            # 负载已由数据库序列化为 JSON，直接以字节拼帧
+            event_id = encode_cursor(collected_at, article_id).encode()
+            yield b"id: " + event_id + b"\ndata: " + payload + b"\n\n"
 
     return StreamingResponse(
         sse_generator(),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
+            # 关闭 Nginx 等反向代理的响应缓冲，每个事件立即下发
+            "X-Accel-Buffering": "no",
         },
     )
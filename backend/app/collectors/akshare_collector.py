@@ -6,21 +6,17 @@ AkShare & RSS Based Collectors
 - 只需配置 URL 和解析参数
 """
 
-import asyncio
 import hashlib
 import logging
-from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
 from app.collectors.base import BaseCollector, RawArticle
 from app.collectors.rss_collector import GenericRSSCollector
-from app.utils.timezone import parse_datetime
+from app.utils.executor import run_blocking
+from app.utils.timezone import SOURCE_TIMEZONES, parse_datetime
 
 logger = logging.getLogger(__name__)
 
-_executor = ThreadPoolExecutor(max_workers=8)
-
-
 # ============================================
 # RSS-based collectors - 复用 GenericRSSCollector
 # ============================================
@@ -57,6 +53,25 @@ def _fetch_cls_telegraph():
         return None
 
 
+def _parse_cls_times(df, source: str) -> list[datetime | None]:
+    """
+    整列解析"发布日期 + 发布时间"为 UTC 时间
+
+    按已知格式一次性向量化解析；解析失败的行返回 None，由调用方逐行兜底。
+    """
+    import pandas as pd
+
+    if "发布日期" not in df.columns or "发布时间" not in df.columns:
+        return [None] * len(df)
+
+    combined = df["发布日期"].astype(str) + " " + df["发布时间"].astype(str)
+    parsed = pd.to_datetime(combined, format="%Y-%m-%d %H:%M:%S", errors="coerce")
+    parsed = parsed.dt.tz_localize(SOURCE_TIMEZONES[source]).dt.tz_convert(
+        timezone.utc
+    )
+    return [None if pd.isna(ts) else ts.to_pydatetime() for ts in parsed]
+
+
 class AkShareCLSCollector(BaseCollector):
     """财联社电报采集器 - 使用 AkShare API"""
 
@@ -64,43 +79,58 @@ class AkShareCLSCollector(BaseCollector):
 
     async def fetch_articles(self) -> list[RawArticle]:
         try:
-            loop = asyncio.get_running_loop()
-            df = await loop.run_in_executor(_executor, _fetch_cls_telegraph)
+            df = await run_blocking(_fetch_cls_telegraph)
 
-            if df is None or df.empty:
+            if df is None or len(df) == 0:
                 return []
 
-            articles = []
-            for idx, row in df.iterrows():
-                title = str(row.get("标题", ""))
+            # 按列取 ndarray 后 zip 遍历，避免 iterrows 逐行构造 Series
+            def column(name: str, default):
+                if name in df.columns:
+                    return df[name].to_numpy()
+                return [default] * len(df)
+
+            rows = []
+            for raw_title, raw_content, raw_date, raw_time, pub_time in zip(
+                column("标题", ""),
+                column("内容", None),
+                column("发布日期", ""),
+                column("发布时间", ""),
+                _parse_cls_times(df, self.source_name),
+            ):
+                title = str(raw_title)
 
                 if not title:
                     continue
 
-                # 组合发布日期和时间
-                pub_date = str(row.get("发布日期", ""))
-                pub_time_str = str(row.get("发布时间", ""))
-                if pub_date and pub_time_str:
-                    datetime_str = f"{pub_date} {pub_time_str}"
-                    pub_time = parse_datetime(datetime_str, self.source_name)
-                else:
-                    pub_time = datetime.now(timezone.utc)
-
-                # 生成唯一URL
-                time_anchor = pub_time.strftime("%Y%m%d%H%M%S")
-                title_hash = hashlib.md5(title.encode()).hexdigest()[:8]
-                url = f"https://www.cls.cn/telegraph#{time_anchor}-{title_hash}"
-
-                content = str(row.get("内容", "")) if "内容" in row else None
-
-                article = RawArticle(
+                if pub_time is None:
+                    # 非标准格式时逐行兜底解析
+                    pub_date = str(raw_date)
+                    pub_time_str = str(raw_time)
+                    if pub_date and pub_time_str:
+                        datetime_str = f"{pub_date} {pub_time_str}"
+                        pub_time = parse_datetime(datetime_str, self.source_name)
+                    else:
+                        pub_time = datetime.now(timezone.utc)
+
+                content = str(raw_content) if raw_content is not None else None
+                rows.append((title, content, pub_time))
+
+            # 批量生成唯一URL：时间锚点 + 标题指纹（非加密用途，4 字节 blake2b 即可）
+            title_hashes = [
+                hashlib.blake2b(title.encode("utf-8"), digest_size=4).hexdigest()
+                for title, _, _ in rows
+            ]
+            articles = [
+                RawArticle(
                     title=title,
-                    url=url,
+                    url=f"https://www.cls.cn/telegraph#{pub_time:%Y%m%d%H%M%S}-{title_hash}",
                     content=content,
                     published_at=pub_time,
                     source_category="快讯",
                 )
-                articles.append(article)
+                for (title, content, pub_time), title_hash in zip(rows, title_hashes)
+            ]
 
             logger.info(f"Fetched {len(articles)} articles from CLS")
             return articles
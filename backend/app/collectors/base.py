@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class RawArticle:
     """Raw article data from collectors."""
     title: str
@@ -20,8 +20,17 @@ class BaseCollector(ABC):
     """Abstract base class for news collectors."""
 
     source_name: str = "unknown"
+    # Set by fetch_articles when the source reports no change since the
+    # last fetch (e.g. HTTP 304); the batch is then skipped entirely.
+    not_modified: bool = False
 
     @abstractmethod
     async def fetch_articles(self) -> list[RawArticle]:
         """Fetch articles from the source."""
         pass
+
+    def on_persisted(self) -> None:
+        """Called once the fetched batch has been committed."""
+
+    def on_discarded(self) -> None:
+        """Called when the fetched batch was not committed."""
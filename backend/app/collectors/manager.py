@@ -13,11 +13,13 @@ Collector Manager - 采集器管理
 
 import logging
 import asyncio
+from contextlib import nullcontext
 from datetime import datetime, timezone
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.collectors.registry import get_collector, get_collector_names
+from app.config import settings
 from app.services.article_persistence import ArticlePersistenceService
 from app.services.collection_log_service import CollectionLogService
 
@@ -27,9 +29,20 @@ logger = logging.getLogger(__name__)
 class CollectorManager:
     """Manages all news collectors."""
 
-    def __init__(self, db: AsyncSession, *, log_session_maker=None):
+    def __init__(
+        self,
+        db: AsyncSession,
+        *,
+        log_session_maker=None,
+        fetch_semaphore: asyncio.Semaphore | None = None,
+        persist_semaphore: asyncio.Semaphore | None = None,
+        timeout: float | None = None,
+    ):
         self.db = db
         self._log_session_maker = log_session_maker
+        self._fetch_semaphore = fetch_semaphore
+        self._persist_semaphore = persist_semaphore
+        self._timeout = timeout
         self.persistence = ArticlePersistenceService(db)
         self.logs = CollectionLogService(db)
 
@@ -74,40 +87,79 @@ class CollectorManager:
         articles_duplicate = 0
         last_article_time = None
 
+        loop = asyncio.get_running_loop()
+        budget = self._timeout
+        # Only expiry of these scopes counts as this source timing out; a
+        # TimeoutError raised by the DB driver or httpx is an ordinary failure
+        fetch_scope = persist_scope = None
+
         try:
-            # Fetch raw articles
-            raw_articles = await collector.fetch_articles()
+            # Fetch raw articles; network fetches and persisting are bounded
+            # separately so raising one limit does not raise the other.
+            # The timeout budget only runs while a slot is held: time spent
+            # queued behind other sources is not charged to this one.
+            async with self._fetch_semaphore or nullcontext():
+                fetch_started = loop.time()
+                async with asyncio.timeout(budget) as fetch_scope:
+                    raw_articles = await collector.fetch_articles()
+                if budget is not None:
+                    budget = max(budget - (loop.time() - fetch_started), 0)
             articles_fetched = len(raw_articles)
-            checkpoint = await self.logs.get_last_checkpoint(source_name)
-
-            # Persist articles
-            (
-                new_articles,
-                duplicate_count,
-                max_published_at,
-            ) = await self.persistence.persist_articles(
-                raw_articles=raw_articles,
-                source_name=collector.source_name,
-                checkpoint=checkpoint,
-            )
-            articles_new = len(new_articles)
-            articles_duplicate = duplicate_count
-            last_article_time = max_published_at
 
-            # Save collection log
-            await self._save_checkpoint_safely(
-                source_name,
-                commit=False,
-                started_at=started_at,
-                finished_at=datetime.now(timezone.utc),
-                status="success",
-                articles_fetched=articles_fetched,
-                articles_new=articles_new,
-                articles_duplicate=articles_duplicate,
-                last_article_time=last_article_time,
-            )
+            async with (
+                self._persist_semaphore or nullcontext(),
+                asyncio.timeout(budget) as persist_scope,
+            ):
+                checkpoint = await self.logs.get_last_checkpoint(source_name)
+
+                if collector.not_modified and checkpoint is None:
+                    # "Not modified" only vouches for a batch that was stored.
+                    # With no committed checkpoint behind it (e.g. the logs
+                    # were purged) it is not a success: drop the validators
+                    # so the next run fetches the source in full.
+                    logger.warning(
+                        f"{source_name} reported not modified without a "
+                        f"committed checkpoint; refetching next run"
+                    )
+                    collector.on_discarded()
+                    return []
+
+                if collector.not_modified:
+                    # Unchanged source: no dedup or insert, and the log keeps
+                    # the previous checkpoint instead of resetting it
+                    new_articles, duplicate_count, max_published_at = [], 0, checkpoint
+                else:
+                    # Persist articles
+                    (
+                        new_articles,
+                        duplicate_count,
+                        max_published_at,
+                    ) = await self.persistence.persist_articles(
+                        raw_articles=raw_articles,
+                        source_name=collector.source_name,
+                        checkpoint=checkpoint,
+                    )
+                articles_new = len(new_articles)
+                articles_duplicate = duplicate_count
+                last_article_time = max_published_at
+
+                # Save collection log
+                await self._save_checkpoint_safely(
+                    source_name,
+                    commit=False,
+                    started_at=started_at,
+                    finished_at=datetime.now(timezone.utc),
+                    status="success",
+                    articles_fetched=articles_fetched,
+                    articles_new=articles_new,
+                    articles_duplicate=articles_duplicate,
+                    last_article_time=last_article_time,
+                )
 
-            await self.db.commit()
+                await self.db.commit()
+            # Only now may the collector treat this batch as stored (e.g. keep
+            # its conditional GET validators for the next poll)
+            collector.on_persisted()
 
             if new_articles:
                 logger.info(
@@ -117,10 +169,22 @@ class CollectorManager:
             return new_articles
 
         except asyncio.CancelledError:
+            collector.on_discarded()
             await self._rollback_quietly()
             raise
         except Exception as e:
-            logger.error(f"Collection failed for {source_name}: {e}")
+            if isinstance(e, TimeoutError) and any(
+                scope is not None and scope.expired()
+                for scope in (fetch_scope, persist_scope)
+            ):
+                logger.warning(
+                    f"Collector {source_name} timed out after {self._timeout}s"
+                )
+                error_message = "timeout"
+            else:
+                logger.error(f"Collection failed for {source_name}: {e}")
+                error_message = str(e)
+            collector.on_discarded()
             await self._rollback_quietly()
 
             await self._save_failure_log(
@@ -132,13 +196,60 @@ class CollectorManager:
                 articles_new=articles_new,
                 articles_duplicate=articles_duplicate,
                 last_article_time=last_article_time,
-                error_message=str(e),
+                error_message=error_message,
             )
             return []
 
     async def collect_all(self) -> dict[str, list]:
-        """Collect from all registered sources."""
+        """Collect from all registered sources.
+
+        With a session factory available, all sources are fetched
+        concurrently, each on its own session (an AsyncSession must not be
+        shared between concurrent tasks). COLLECTION_MAX_CONCURRENT_FETCHES
+        bounds in-flight fetches, COLLECTION_MAX_CONCURRENCY bounds how many
+        sources persist at once and COLLECTOR_TIMEOUT_SECONDS caps the
+        time each source spends fetching and persisting, not counting the
+        time it waits for a slot.
+        """
+        source_names = get_collector_names()
+        if self._log_session_maker is None:
+            results = {}
+            for source_name in source_names:
+                results[source_name] = await self.collect_from(source_name)
+            return results
+
+        fetch_semaphore = asyncio.Semaphore(
+            settings.COLLECTION_MAX_CONCURRENT_FETCHES
+            or settings.COLLECTION_MAX_CONCURRENCY
+        )
+        persist_semaphore = asyncio.Semaphore(settings.COLLECTION_MAX_CONCURRENCY)
+        timeout = settings.COLLECTOR_TIMEOUT_SECONDS
+
+        async def _collect_isolated(source_name: str) -> list:
+            # The session only checks out a connection once persisting starts
+            async with self._log_session_maker() as db:
+                manager = CollectorManager(
+                    db,
+                    log_session_maker=self._log_session_maker,
+                    fetch_semaphore=fetch_semaphore,
+                    persist_semaphore=persist_semaphore,
+                    timeout=timeout,
+                )
+                # Per-source budget so one hung feed cannot hold up the batch;
+                # collect_from logs a timeout as a failure and returns []
+                return await manager.collect_from(source_name)
+
+        outcomes = await asyncio.gather(
+            *(_collect_isolated(name) for name in source_names),
+            return_exceptions=True,
+        )
+
         results = {}
-        for source_name in get_collector_names():
-            results[source_name] = await self.collect_from(source_name)
+        for source_name, outcome in zip(source_names, outcomes):
+            if isinstance(outcome, BaseException):
+                if isinstance(outcome, asyncio.CancelledError):
+                    raise outcome
+                logger.error(f"Collection error for {source_name}: {outcome}")
+                outcome = []
+            results[source_name] = outcome
         return results
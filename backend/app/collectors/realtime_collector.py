@@ -1,19 +1,28 @@
-import asyncio
 import logging
-from concurrent.futures import ThreadPoolExecutor
+import re
+import zlib
 from datetime import datetime, timezone, timedelta
-import hashlib
+
+import orjson
 
 from app.collectors.base import BaseCollector, RawArticle
 
 logger = logging.getLogger(__name__)
 
-_executor = ThreadPoolExecutor(max_workers=4)
+# 金十数据返回的是北京时间（CST, UTC+8）
+_CST = timezone(timedelta(hours=8))
+
+# 金十快讯标题中的 <b>/</b> 直接去掉，<br> 换成空格；一次扫描完成
+_JIN10_MARKUP_RE = re.compile(r"(</?b>)|<br\s*/?>")
+
+
+def _clean_jin10_markup(match: re.Match) -> str:
+    return "" if match.group(1) else " "
 
 
-def _fetch_jin10():
+async def _fetch_jin10():
     """金十数据快讯 - 需要特定 headers"""
-    from app.utils.http_client import request
+    from app.utils.http_client import request_async
     from app.config import settings
 
     try:
@@ -27,7 +36,7 @@ def _fetch_jin10():
             "x-version": settings.JIN10_VERSION,
         }
         # 注意：不要设置 accept-encoding，让 httpx 自动处理
-        resp = request(
+        resp = await request_async(
             "GET",
             "https://flash-api.jin10.com/get_flash_list",
             params={"channel": "-8200", "vip": "1"},
@@ -35,18 +44,19 @@ def _fetch_jin10():
             timeout=10,
         )
         if resp.status_code == 200:
-            return resp.json().get("data", [])
+            # 直接从字节解码，省去 httpx 先解码成 str 再交给 json 的一步
+            return orjson.loads(resp.content).get("data", [])
     except Exception as e:
         logger.error(f"Jin10 fetch error: {e}")
     return []
 
 
-def _fetch_wallstreet():
+async def _fetch_wallstreet():
     """华尔街见闻"""
-    from app.utils.http_client import request
+    from app.utils.http_client import request_async
 
     try:
-        resp = request(
+        resp = await request_async(
             "GET",
             "https://api-one.wallstcn.com/apiv1/content/lives",
             params={"channel": "global-channel", "limit": 50},
@@ -54,7 +64,7 @@ def _fetch_wallstreet():
             timeout=10,
         )
         if resp.status_code == 200:
-            return resp.json().get("data", {}).get("items", [])
+            return orjson.loads(resp.content).get("data", {}).get("items", [])
     except Exception as e:
         logger.error(f"Wallstreet fetch error: {e}")
     return []
@@ -67,12 +77,12 @@ class Jin10Collector(BaseCollector):
 
     async def fetch_articles(self) -> list[RawArticle]:
         try:
-            loop = asyncio.get_running_loop()
-            items = await loop.run_in_executor(_executor, _fetch_jin10)
+            items = await _fetch_jin10()
 
             if not items:
                 return []
 
+            now_utc = datetime.now(timezone.utc)
             articles = []
             for item in items:
                 content = item.get("data", {})
@@ -82,8 +92,7 @@ class Jin10Collector(BaseCollector):
                     continue
 
                 # 清理 HTML 标签
-                title = title.replace("<b>", "").replace("</b>", "")
-                title = title.replace("<br>", " ").replace("<br/>", " ")
+                title = _JIN10_MARKUP_RE.sub(_clean_jin10_markup, title)
 
                 if len(title) > 200:
                     title = title[:200] + "..."
@@ -91,20 +100,21 @@ class Jin10Collector(BaseCollector):
                 pub_time = item.get("time", "")
                 if pub_time:
                     try:
-                        # 金十数据返回的是北京时间（CST, UTC+8）
-                        pub_time = datetime.strptime(pub_time, "%Y-%m-%d %H:%M:%S")
+                        # 固定格式 "%Y-%m-%d %H:%M:%S"，fromisoformat 比 strptime 快
+                        pub_time = datetime.fromisoformat(pub_time)
                         # 正确标记为东八区时间
-                        china_tz = timezone(timedelta(hours=8))
-                        pub_time = pub_time.replace(tzinfo=china_tz)
-                        pub_time = pub_time.astimezone(timezone.utc)
+                        pub_time = pub_time.replace(tzinfo=_CST).astimezone(timezone.utc)
                     except ValueError:
-                        pub_time = datetime.now(timezone.utc)
+                        pub_time = now_utc
                 else:
-                    pub_time = datetime.now(timezone.utc)
+                    pub_time = now_utc
 
                 # 生成唯一 URL
                 # 金十快讯没有独立详情页，使用快讯列表页锚点
-                item_id = item.get("id", hashlib.md5(title.encode()).hexdigest()[:8])
+                # 缺少 id 时才用标题 CRC32 兜底（仅作锚点，无需加密哈希）
+                item_id = item.get("id")
+                if item_id is None:
+                    item_id = format(zlib.crc32(title.encode()), "08x")
 
                 article = RawArticle(
                     title=title,
@@ -130,12 +140,12 @@ class WallstreetCollector(BaseCollector):
 
     async def fetch_articles(self) -> list[RawArticle]:
         try:
-            loop = asyncio.get_running_loop()
-            items = await loop.run_in_executor(_executor, _fetch_wallstreet)
+            items = await _fetch_wallstreet()
 
             if not items:
                 return []
 
+            now_utc = datetime.now(timezone.utc)
             articles = []
             for item in items:
                 title = item.get("content_text", "") or item.get("title", "")
@@ -147,7 +157,7 @@ class WallstreetCollector(BaseCollector):
                 if pub_time:
                     pub_time = datetime.fromtimestamp(pub_time, tz=timezone.utc)
                 else:
-                    pub_time = datetime.now(timezone.utc)
+                    pub_time = now_utc
 
                 item_id = item.get("id", "")
 
@@ -165,7 +175,7 @@ class WallstreetCollector(BaseCollector):
                     url = f"https://wallstreetcn.com/livenews#{item_id}"
 
                 article = RawArticle(
-                    title=title[:500] if len(title) > 500 else title,
+                    title=title[:500],
                     url=url,
                     content=title,
                     published_at=pub_time,
@@ -2,18 +2,43 @@
 
 import asyncio
 import logging
-import xml.etree.ElementTree as ET
 from collections.abc import Iterable
-from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
+from lxml import etree
+
 from app.collectors.base import BaseCollector, RawArticle
-from app.collectors.rss_parsers import RSS20Parser, RSSParser
+from app.collectors.rss_parsers import XML_PARSER, ParsedItem, RSS20Parser, RSSParser
 
 logger = logging.getLogger(__name__)
 
-# Thread pool for blocking RSS fetch operations
-_executor = ThreadPoolExecutor(max_workers=8)
+# (ETag, Last-Modified) of a feed response
+Validators = tuple[str | None, str | None]
+
+# Conditional GET validators: url -> (ETag, Last-Modified). Only stored
+# once the items of that response have been committed, so a 304 means "same
+# items as the last stored batch" and the collector reports not_modified
+# instead of re-persisting them.
+_feed_cache: dict[str, Validators] = {}
+
+
+# Shared by every feed request; copied only when conditional headers are added
+_FEED_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+}
+
+# UTF-8 markers of anti-bot/captcha pages, matched on the raw bytes
+_CAPTCHA_MARKERS = tuple(
+    marker.encode("utf-8") for marker in ("请完成下列验证后继续", "拼图")
+)
+
+
+def _blocked_hint(content: bytes) -> str:
+    """Recognise anti-bot/captcha pages served in place of the feed."""
+    preview = content[:4096]
+    if any(marker in preview for marker in _CAPTCHA_MARKERS):
+        return " (可能被验证码/反爬拦截)"
+    return ""
 
 
 class GenericRSSCollector(BaseCollector):
@@ -29,33 +54,36 @@ class GenericRSSCollector(BaseCollector):
     parser_class: type[RSSParser] = RSS20Parser
 
     def __init__(self):
+        # A fresh parser per collector, i.e. per collection run: parser state
+        # such as the last date-format hint never leaks into another run
         try:
             self.parser = self.parser_class(source_name=self.source_name)
         except TypeError:
             self.parser = self.parser_class()
+        # (url, validators) of the response the current batch came from;
+        # written to _feed_cache only after the manager commits the batch
+        self._fetched_from: tuple[str, Validators | None] | None = None
 
     async def fetch_articles(self) -> list[RawArticle]:
         """Fetch and parse RSS feed"""
         try:
-            loop = asyncio.get_running_loop()
-            items = await loop.run_in_executor(_executor, self._fetch_rss)
+            items = await self._fetch_rss()
 
+            if items is None:
+                self.not_modified = True
+                logger.info(f"{self.source_name} RSS not modified")
+                return []
             if not items:
                 return []
 
-            articles = []
-            for item_data in items:
-                if not item_data["title"] or not item_data["url"]:
-                    continue
-
-                article = RawArticle(
-                    title=item_data["title"],
-                    url=item_data["url"],
-                    content=item_data["content"],
-                    published_at=item_data["published_at"],
-                    source_category=self.source_category,
+            # Items are already filtered to those with a title and link
+            category = self.source_category
+            articles = [
+                RawArticle(
+                    title, url, content, published_at=pubdate, source_category=category
                 )
-                articles.append(article)
+                for title, url, content, pubdate in items
+            ]
 
             logger.info(f"Fetched {len(articles)} articles from {self.source_name} RSS")
             return articles
@@ -64,14 +92,27 @@ class GenericRSSCollector(BaseCollector):
             logger.error(f"Error fetching from {self.source_name}: {e}")
             return []
 
-    def _fetch_rss(self) -> list[dict]:
-        """Fetch and parse RSS feed (blocking operation)"""
-        from app.utils.http_client import request
-
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-        }
-
+    def on_persisted(self) -> None:
+        """Remember the validators of the committed response"""
+        if self._fetched_from is None:
+            return
+        url, validators = self._fetched_from
+        self._fetched_from = None
+        if validators:
+            _feed_cache[url] = validators
+        else:
+            _feed_cache.pop(url, None)
+
+    def on_discarded(self) -> None:
+        """Forget the validators so the next poll downloads the feed in full"""
+        if self._fetched_from is None:
+            return
+        url, _ = self._fetched_from
+        self._fetched_from = None
+        _feed_cache.pop(url, None)
+
+    async def _fetch_rss(self) -> list[ParsedItem] | None:
+        """Fetch and parse RSS feed, racing mirror URLs; None if not modified"""
         urls = (
             [self.rss_url]
             if isinstance(self.rss_url, str)
@@ -79,67 +120,108 @@ class GenericRSSCollector(BaseCollector):
             if isinstance(self.rss_url, Iterable)
             else []
         )
+        if not urls:
+            return []
+        if len(urls) == 1:
+            results, validators = await self._fetch_one(urls[0])
+            if results is None or results:
+                self._fetched_from = (urls[0], validators)
+            return results
+
+        # All mirrors are requested at once, but results are still taken in
+        # the configured order: the first URL that yields items (or reports
+        # not modified) wins and the remaining requests are cancelled.
+        tasks = [asyncio.create_task(self._fetch_one(url)) for url in urls]
+        try:
+            for url, task in zip(urls, tasks):
+                results, validators = await task
+                if results is None or results:
+                    self._fetched_from = (url, validators)
+                    return results
+            return []
+        finally:
+            for task in tasks:
+                task.cancel()
 
-        for url in urls:
-            try:
-                resp = request(
-                    "GET",
-                    url,
-                    headers=headers,
-                    timeout=15,
-                    follow_redirects=True,
+    async def _fetch_one(
+        self, url: str
+    ) -> tuple[list[ParsedItem] | None, Validators | None]:
+        """Fetch and parse a single feed URL
+
+        Returns the items (None if the server sent 304) and the response's
+        validators, which the caller stores only once the items are committed.
+        """
+        from app.utils.http_client import request_async
+
+        try:
+            cached = _feed_cache.get(url)
+            request_headers = _FEED_HEADERS
+            if cached is not None:
+                etag, last_modified = cached
+                request_headers = dict(_FEED_HEADERS)
+                if etag:
+                    request_headers["If-None-Match"] = etag
+                if last_modified:
+                    request_headers["If-Modified-Since"] = last_modified
+
+            resp = await request_async(
+                "GET",
+                url,
+                headers=request_headers,
+                timeout=15,
+                follow_redirects=True,
+            )
+
+            if resp.status_code == 304 and cached is not None:
+                return None, cached
+
+            if resp.status_code != 200:
+                logger.warning(
+                    f"{self.source_name} RSS returned {resp.status_code}: {url}"
                 )
+                return [], None
 
-                if resp.status_code != 200:
-                    logger.warning(
-                        f"{self.source_name} RSS returned {resp.status_code}: {url}"
-                    )
-                    continue
-
-                try:
-                    root = ET.fromstring(resp.content)
-                except ET.ParseError as e:
-                    hint = ""
-                    try:
-                        preview = resp.content[:4096].decode("utf-8", "ignore")
-                        if "请完成下列验证后继续" in preview or "拼图" in preview:
-                            hint = " (可能被验证码/反爬拦截)"
-                    except Exception:
-                        pass
-                    logger.warning(
-                        f"{self.source_name} RSS XML parse failed{hint}: {url} {e}"
-                    )
-                    continue
-
-                items = self.parser.parse_items(root)
-                if not items:
-                    continue
-
-                results = []
-                for item in items:
-                    title = self.parser.parse_title(item)
-                    link = self.parser.parse_link(item)
-                    content = self.parser.parse_content(item)
-                    pubdate = self.parser.parse_pubdate(item)
-
-                    if title and link:
-                        results.append(
-                            {
-                                "title": title,
-                                "url": link,
-                                "content": content,
-                                "published_at": pubdate,
-                            }
-                        )
-
-                if results:
-                    return results
+            # recover=True salvages feeds with stray markup; a body that
+            # yields no root at all still counts as a parse failure
+            try:
+                root = etree.fromstring(resp.content, XML_PARSER)
+            except etree.XMLSyntaxError as e:
+                root, error = None, e
+            else:
+                error = "no XML root"
+            if root is None:
+                logger.warning(
+                    f"{self.source_name} RSS XML parse failed"
+                    f"{_blocked_hint(resp.content)}: {url} {error}"
+                )
+                return [], None
 
-            except Exception as e:
-                logger.warning(f"Error fetching/parsing {self.source_name} RSS: {url} {e}")
-                continue
+            items = self.parser.parse_items(root)
+            if not items:
+                hint = _blocked_hint(resp.content)
+                if hint:
+                    logger.warning(f"{self.source_name} RSS has no items{hint}: {url}")
+                return [], None
+
+            # Keep only items with both a title and a link; 'now' is taken
+            # once per feed for the parser's future-date check
+            now = datetime.now(timezone.utc)
+            parse_item = self.parser.parse_item
+            results = [
+                parsed
+                for parsed in (parse_item(item, now) for item in items)
+                if parsed[0] and parsed[1]
+            ]
+
+            if not results:
+                return [], None
+            etag = resp.headers.get("etag")
+            last_modified = resp.headers.get("last-modified")
+            return results, (etag, last_modified) if etag or last_modified else None
 
-        return []
+        except Exception as e:
+            logger.warning(f"Error fetching/parsing {self.source_name} RSS: {url} {e}")
+            return [], None
 
 
 # Concrete RSS Collectors - Low coupling, only configuration
@@ -1,90 +1,230 @@
 import logging
 import re
-import xml.etree.ElementTree as ET
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Iterable
 from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Optional
 
+import lxml.html
+from lxml import etree
+
 from app.utils.timezone import SOURCE_TIMEZONES
 from zoneinfo import ZoneInfo
 
 logger = logging.getLogger(__name__)
 
+_UTC = ZoneInfo("UTC")
+
+CONTENT_NS = "{http://purl.org/rss/1.0/modules/content/}"
+
+_RSS_CONTENT_TAGS = ("description", "content", f"{CONTENT_NS}encoded")
+_RSS_DATE_TAGS = ("pubDate", "{http://purl.org/dc/elements/1.1/}date")
+_DATE_LOCAL_NAMES = frozenset({"pubdate", "date", "published", "updated"})
+# 完整标签（含命名空间）-> 是否为日期字段；订阅源里的标签种类很少，判定一次即可
+_date_tag_flags: dict[str, bool] = {}
+
+
+def _is_date_tag(tag: str) -> bool:
+    flag = _date_tag_flags.get(tag)
+    if flag is None:
+        flag = _date_tag_flags[tag] = (
+            tag.rpartition("}")[2].lower() in _DATE_LOCAL_NAMES
+        )
+    return flag
+
+
+# (title, link, content, pubdate)
+ParsedItem = tuple[Optional[str], Optional[str], Optional[str], Optional[datetime]]
+
+# 逐条目调用的正则预编译为模块级常量
+_WHITESPACE_RE = re.compile(r"\s+")
+_CST_SUFFIX_RE = re.compile(r"\bCST\b$")
+
+CONTENT_MAX_CHARS = 1000
+
+
+def _strip_tags(text: str, limit: int = CONTENT_MAX_CHARS) -> str:
+    """
+    用 lxml.html 解析 HTML 片段，取纯文本（实体已解码）并截断到 limit 个字符
+
+    实体只在解析时解码一次，解码出的 "<script>" 等只是文字，不会再被当作标签；
+    真正的 <script>/<style> 元素连同内容一起去掉。
+    """
+    if not text:
+        return ""
+    fragment = lxml.html.fragment_fromstring(text, create_parent="div")
+    for elem in list(fragment.iter("script", "style")):
+        elem.drop_tree()
+    return fragment.text_content()[:limit]
+
+
+# 日期解析候选：RFC 822、ISO 8601，再依次尝试固定格式
+_STRPTIME_FORMATS = (
+    "%a, %d %b %Y %H:%M:%S %z",
+    "%a, %d %b %Y %H:%M:%S",
+    "%Y-%m-%d %H:%M:%S %z",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S%z",
+    "%Y-%m-%dT%H:%M:%SZ",
+)
+_STRPTIME_PARSERS = {
+    fmt: (lambda text, fmt=fmt: datetime.strptime(text, fmt))
+    for fmt in _STRPTIME_FORMATS
+}
+_DATE_PARSERS = (
+    parsedate_to_datetime,
+    lambda text: datetime.fromisoformat(text.replace("Z", "+00:00")),
+    *_STRPTIME_PARSERS.values(),
+)
+# 按字符串形态排好的候选顺序：数字开头时 ISO 8601 系列优先，
+# 其余沿用 RFC 822 优先的默认顺序；形态只决定先后，不排除任何解析方式
+_ISO_FIRST_PARSERS = (
+    _DATE_PARSERS[1],
+    *(p for fmt, p in _STRPTIME_PARSERS.items() if fmt.startswith("%Y")),
+    _DATE_PARSERS[0],
+    *(p for fmt, p in _STRPTIME_PARSERS.items() if not fmt.startswith("%Y")),
+)
+
+# 已解析日期缓存：(时区, 原始字符串) -> UTC 时间（无法解析时为 None）。
+# 相邻两轮抓取的条目大多相同，命中后跳过正则与各格式尝试；
+# 未来时间校验依赖当前时间，不进缓存。
+_PARSED_DATES_MAX = 4096
+_parsed_dates: OrderedDict[tuple[str, str], Optional[datetime]] = OrderedDict()
+
+# lxml 解析器：去掉注释/处理指令（子节点迭代只剩元素），禁用实体展开与网络访问；
+# recover 容忍未转义的 & 等常见脏数据，不再因单个坏字符丢掉整个订阅源
+XML_PARSER = etree.XMLParser(
+    remove_comments=True,
+    remove_pis=True,
+    resolve_entities=False,
+    no_network=True,
+    recover=True,
+)
+
 
 class RSSParser(ABC):
     def __init__(self, source_name: str = "unknown"):
         self.source_name = source_name
+        # 时区在构造时解析一次，逐条目不再查表
+        self._default_tz = SOURCE_TIMEZONES.get(source_name) or _UTC
 
     @abstractmethod
-    def parse_items(self, root: ET.Element) -> list[ET.Element]:
+    def parse_items(self, root: etree._Element) -> list[etree._Element]:
         pass
 
     @abstractmethod
-    def parse_title(self, item: ET.Element) -> Optional[str]:
+    def parse_title(self, item: etree._Element) -> Optional[str]:
         pass
 
     @abstractmethod
-    def parse_link(self, item: ET.Element) -> Optional[str]:
+    def parse_link(self, item: etree._Element) -> Optional[str]:
         pass
 
     @abstractmethod
-    def parse_content(self, item: ET.Element) -> Optional[str]:
+    def parse_content(self, item: etree._Element) -> Optional[str]:
         pass
 
     @abstractmethod
-    def parse_pubdate(self, item: ET.Element) -> Optional[datetime]:
+    def parse_pubdate(self, item: etree._Element) -> Optional[datetime]:
         pass
 
+    def parse_item(
+        self, item: etree._Element, now: datetime | None = None
+    ) -> ParsedItem:
+        """一次取出 (title, link, content, pubdate)；子类可改为单次遍历子节点
+
+        now 为本批次的当前时间（调用方每个订阅源取一次），用于未来时间校验；
+        缺省时按实时时钟处理。
+        """
+        return (
+            self.parse_title(item),
+            self.parse_link(item),
+            self.parse_content(item),
+            self.parse_pubdate(item),
+        )
+
+    @staticmethod
+    def _index_children(item: etree._Element) -> dict[str, etree._Element]:
+        """单次遍历子节点，记录每个标签的第一个元素（与 find 的语义一致）"""
+        first: dict[str, etree._Element] = {}
+        for child in item:
+            tag = child.tag
+            # resolve_entities=False 时未展开的实体也是子节点，其 tag 不是字符串
+            if isinstance(tag, str) and tag not in first:
+                first[tag] = child
+        return first
+
 
 class RSS20Parser(RSSParser):
     def __init__(self, source_name: str = "unknown"):
         super().__init__(source_name=source_name)
-
-    def parse_items(self, root: ET.Element) -> list[ET.Element]:
-        return root.findall(".//item")
-
-    def parse_title(self, item: ET.Element) -> Optional[str]:
-        elem = item.find("title")
+        # 同一订阅源的日期格式基本一致，先试上次成功的解析方式，避免逐个抛异常
+        self._last_date_parser = _DATE_PARSERS[0]
+
+    def parse_items(self, root: etree._Element) -> list[etree._Element]:
+        return list(root.iter("item"))
+
+    def parse_item(
+        self, item: etree._Element, now: datetime | None = None
+    ) -> ParsedItem:
+        first = self._index_children(item)
+        return (
+            self._text_of(first.get("title")),
+            self._text_of(first.get("link")),
+            self._content_of(first.get(tag) for tag in _RSS_CONTENT_TAGS),
+            self._pubdate_of((first.get(tag) for tag in _RSS_DATE_TAGS), item, now),
+        )
+
+    def parse_title(self, item: etree._Element) -> Optional[str]:
+        return self._text_of(item.find("title"))
+
+    def parse_link(self, item: etree._Element) -> Optional[str]:
+        return self._text_of(item.find("link"))
+
+    def parse_content(self, item: etree._Element) -> Optional[str]:
+        return self._content_of(item.find(tag) for tag in _RSS_CONTENT_TAGS)
+
+    def parse_pubdate(self, item: etree._Element) -> Optional[datetime]:
+        # 一次遍历子节点代替 pubDate、dc:date 各一次 find
+        first = self._index_children(item)
+        return self._pubdate_of((first.get(tag) for tag in _RSS_DATE_TAGS), item, None)
+
+    def _text_of(self, elem: etree._Element | None) -> Optional[str]:
         if elem is not None and elem.text:
             return self._clean_cdata(elem.text.strip())
         return None
 
-    def parse_link(self, item: ET.Element) -> Optional[str]:
-        elem = item.find("link")
-        if elem is not None and elem.text:
-            return self._clean_cdata(elem.text.strip())
-        return None
-
-    def parse_content(self, item: ET.Element) -> Optional[str]:
-        for field in ["description", "content", "content:encoded"]:
-            elem = item.find(field)
+    def _content_of(
+        self, elems: Iterable[etree._Element | None]
+    ) -> Optional[str]:
+        for elem in elems:
             if elem is not None and elem.text:
-                content = self._clean_cdata(elem.text.strip())
-                content = re.sub(r"<[^>]+>", "", content)
-                return content[:1000] if content else None
+                content = _strip_tags(self._clean_cdata(elem.text.strip()))
+                return content or None
         return None
 
-    def parse_pubdate(self, item: ET.Element) -> Optional[datetime]:
-        candidates = [
-            "pubDate",
-            "{http://purl.org/dc/elements/1.1/}date",
-        ]
-
-        for tag in candidates:
-            elem = item.find(tag)
+    def _pubdate_of(
+        self,
+        elems: Iterable[etree._Element | None],
+        item: etree._Element,
+        now: datetime | None,
+    ) -> Optional[datetime]:
+        for elem in elems:
             if elem is not None and elem.text:
-                parsed = self._parse_datetime(elem.text.strip())
+                parsed = self._parse_datetime(elem.text.strip(), now)
                 if parsed is not None:
                     return parsed
 
-        for child in list(item):
-            if child.text is None:
-                continue
+        # 兜底：任意命名空间下形如 date / published / updated 的子节点
+        for child in item:
             tag = child.tag
-            local_name = tag.split("}", 1)[1] if "}" in tag else tag
-            if local_name.lower() not in {"pubdate", "date", "published", "updated"}:
+            if child.text is None or not isinstance(tag, str):
                 continue
-            parsed = self._parse_datetime(child.text.strip())
+            if not _is_date_tag(tag):
+                continue
+            parsed = self._parse_datetime(child.text.strip(), now)
             if parsed is not None:
                 return parsed
 
@@ -92,67 +232,59 @@ class RSS20Parser(RSSParser):
 
     @staticmethod
     def _clean_cdata(text: str) -> str:
-        if text.startswith("<![CDATA[") and text.endswith("]]>"):
-            return text[9:-3].strip()
+        # 无 CDATA 时 removeprefix 原样返回同一对象，常见路径不产生切片
+        inner = text.removeprefix("<![CDATA[")
+        if inner is not text and inner.endswith("]]>"):
+            return inner.removesuffix("]]>").strip()
         return text
 
-    def _parse_datetime(self, date_str: str) -> Optional[datetime]:
+    def _parse_datetime(
+        self, date_str: str, now: datetime | None = None
+    ) -> Optional[datetime]:
         if not date_str:
             return None
 
-        cleaned = re.sub(r"\s+", " ", date_str.strip())
-        default_tz = SOURCE_TIMEZONES.get(self.source_name, ZoneInfo("UTC"))
+        key = (self._default_tz.key, date_str)
+        if key in _parsed_dates:
+            _parsed_dates.move_to_end(key)
+            dt = _parsed_dates[key]
+        else:
+            dt = self._parse_to_utc(date_str)
+            _parsed_dates[key] = dt
+            if len(_parsed_dates) > _PARSED_DATES_MAX:
+                _parsed_dates.popitem(last=False)
+
+        if dt is None:
+            return None
+        return self._validate_and_fix_datetime(
+            dt, date_str, now or datetime.now(timezone.utc)
+        )
+
+    def _parse_to_utc(self, date_str: str) -> Optional[datetime]:
+        cleaned = _WHITESPACE_RE.sub(" ", date_str.strip())
+        default_tz = self._default_tz
         if default_tz.key == "Asia/Shanghai":
-            cleaned = re.sub(r"\bCST\b$", "+0800", cleaned)
-
-        try:
-            from email.utils import parsedate_to_datetime
-
-            dt = parsedate_to_datetime(cleaned)
-            if dt is not None:
-                if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=default_tz)
-                dt = dt.astimezone(timezone.utc)
-                return self._validate_and_fix_datetime(dt, date_str)
-        except (TypeError, ValueError):
-            pass
-
-        try:
-            dt = datetime.fromisoformat(cleaned.replace("Z", "+00:00"))
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=default_tz)
-            dt = dt.astimezone(timezone.utc)
-            return self._validate_and_fix_datetime(dt, date_str)
-        except ValueError:
-            pass
-
-        formats = [
-            "%a, %d %b %Y %H:%M:%S %z",
-            "%a, %d %b %Y %H:%M:%S",
-            "%Y-%m-%d %H:%M:%S %z",
-            "%Y-%m-%d %H:%M:%S",
-            "%Y-%m-%dT%H:%M:%S%z",
-            "%Y-%m-%dT%H:%M:%SZ",
-        ]
-
-        for fmt in formats:
+            cleaned = _CST_SUFFIX_RE.sub("+0800", cleaned)
+
+        last = self._last_date_parser
+        candidates = _ISO_FIRST_PARSERS if cleaned[:1].isdigit() else _DATE_PARSERS
+        for parse in (last, *(p for p in candidates if p is not last)):
             try:
-                dt = datetime.strptime(cleaned, fmt)
-                if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=default_tz)
-                dt = dt.astimezone(timezone.utc)
-                return self._validate_and_fix_datetime(dt, date_str)
-            except ValueError:
+                dt = parse(cleaned)
+            except (TypeError, ValueError):
                 continue
+            self._last_date_parser = parse
+            if dt.tzinfo is None:
+                dt = dt.replace(tzinfo=default_tz)
+            return dt.astimezone(timezone.utc)
 
         logger.warning(f"Could not parse date: {date_str}")
         return None
 
     @staticmethod
     def _validate_and_fix_datetime(
-        dt: datetime, original_str: str
+        dt: datetime, original_str: str, now: datetime
     ) -> Optional[datetime]:
-        now = datetime.now(timezone.utc)
         diff = (dt - now).total_seconds()
 
         if diff > 86400:
@@ -180,38 +312,68 @@ class RSS20Parser(RSSParser):
 class AtomParser(RSSParser):
     ATOM_NS = "{http://www.w3.org/2005/Atom}"
 
-    def parse_items(self, root: ET.Element) -> list[ET.Element]:
-        return root.findall(f".//{self.ATOM_NS}entry")
+    def parse_items(self, root: etree._Element) -> list[etree._Element]:
+        return list(root.iter(f"{self.ATOM_NS}entry"))
+
+    def parse_item(
+        self, item: etree._Element, now: datetime | None = None
+    ) -> ParsedItem:
+        first = self._index_children(item)
+        ns = self.ATOM_NS
+        return (
+            self._title_of(first.get(f"{ns}title")),
+            self._link_of(first.get(f"{ns}link")),
+            self._content_of((first.get(f"{ns}content"), first.get(f"{ns}summary"))),
+            self._pubdate_of((first.get(f"{ns}published"), first.get(f"{ns}updated"))),
+        )
+
+    def parse_title(self, item: etree._Element) -> Optional[str]:
+        return self._title_of(item.find(f"{self.ATOM_NS}title"))
+
+    def parse_link(self, item: etree._Element) -> Optional[str]:
+        return self._link_of(item.find(f"{self.ATOM_NS}link"))
+
+    def parse_content(self, item: etree._Element) -> Optional[str]:
+        return self._content_of(
+            item.find(field)
+            for field in [f"{self.ATOM_NS}content", f"{self.ATOM_NS}summary"]
+        )
+
+    def parse_pubdate(self, item: etree._Element) -> Optional[datetime]:
+        return self._pubdate_of(
+            item.find(field)
+            for field in [f"{self.ATOM_NS}published", f"{self.ATOM_NS}updated"]
+        )
 
-    def parse_title(self, item: ET.Element) -> Optional[str]:
-        elem = item.find(f"{self.ATOM_NS}title")
+    @staticmethod
+    def _title_of(elem: etree._Element | None) -> Optional[str]:
         if elem is not None and elem.text:
             return elem.text.strip()
         return None
 
-    def parse_link(self, item: ET.Element) -> Optional[str]:
-        elem = item.find(f"{self.ATOM_NS}link")
+    @staticmethod
+    def _link_of(elem: etree._Element | None) -> Optional[str]:
         if elem is not None:
             return elem.get("href")
         return None
 
-    def parse_content(self, item: ET.Element) -> Optional[str]:
-        for field in [f"{self.ATOM_NS}content", f"{self.ATOM_NS}summary"]:
-            elem = item.find(field)
+    @staticmethod
+    def _content_of(elems: Iterable[etree._Element | None]) -> Optional[str]:
+        for elem in elems:
             if elem is not None and elem.text:
-                content = re.sub(r"<[^>]+>", "", elem.text.strip())
-                return content[:1000] if content else None
+                content = _strip_tags(elem.text.strip())
+                return content or None
         return None
 
-    def parse_pubdate(self, item: ET.Element) -> Optional[datetime]:
-        for field in [f"{self.ATOM_NS}published", f"{self.ATOM_NS}updated"]:
-            elem = item.find(field)
+    def _pubdate_of(
+        self, elems: Iterable[etree._Element | None]
+    ) -> Optional[datetime]:
+        for elem in elems:
             if elem is not None and elem.text:
                 try:
                     dt = datetime.fromisoformat(elem.text.strip().replace("Z", "+00:00"))
-                    default_tz = SOURCE_TIMEZONES.get(self.source_name, ZoneInfo("UTC"))
                     if dt.tzinfo is None:
-                        dt = dt.replace(tzinfo=default_tz)
+                        dt = dt.replace(tzinfo=self._default_tz)
                     return dt.astimezone(timezone.utc)
                 except ValueError:
                     pass
@@ -0,0 +1,67 @@
+import unittest
+from datetime import date, datetime, time, timedelta, timezone
+
+import pandas as pd
+
+from app.collectors.akshare_collector import _parse_cls_times
+from app.utils.timezone import normalize_to_utc
+
+# 财联社时间为北京时间（UTC+8）
+_CST = timezone(timedelta(hours=8))
+
+
+class TestParseClsTimes(unittest.TestCase):
+    def test_converts_beijing_time_to_utc_across_midnight(self):
+        df = pd.DataFrame(
+            {
+                "发布日期": ["2026-10-15", "2026-10-15", "2026-10-14", "2026-01-01"],
+                "发布时间": ["07:30:00", "00:00:00", "23:59:59", "05:00:00"],
+            }
+        )
+        self.assertEqual(
+            _parse_cls_times(df, "cls"),
+            [
+                datetime(2026, 10, 14, 23, 30, tzinfo=timezone.utc),
+                datetime(2026, 10, 14, 16, 0, tzinfo=timezone.utc),
+                datetime(2026, 10, 14, 15, 59, 59, tzinfo=timezone.utc),
+                # Crosses the year boundary as well as the day
+                datetime(2025, 12, 31, 21, 0, tzinfo=timezone.utc),
+            ],
+        )
+
+    def test_matches_row_by_row_conversion(self):
+        local = datetime(2026, 10, 15, 8, 0, 0)
+        df = pd.DataFrame({"发布日期": [local.date()], "发布时间": [local.time()]})
+        (parsed,) = _parse_cls_times(df, "cls")
+        self.assertEqual(parsed, normalize_to_utc(local, "cls"))
+        self.assertEqual(parsed, local.replace(tzinfo=_CST))
+        self.assertEqual(parsed.utcoffset(), timedelta(0))
+
+    def test_date_and_time_objects(self):
+        df = pd.DataFrame(
+            {"发布日期": [date(2026, 10, 15)], "发布时间": [time(0, 15, 30)]}
+        )
+        self.assertEqual(
+            _parse_cls_times(df, "cls"),
+            [datetime(2026, 10, 14, 16, 15, 30, tzinfo=timezone.utc)],
+        )
+
+    def test_unparseable_rows_are_none(self):
+        df = pd.DataFrame(
+            {
+                "发布日期": ["2026-10-15", "", "2026-13-01", "2026-10-15"],
+                "发布时间": ["12:00:00", "12:00:00", "12:00:00", "12:00"],
+            }
+        )
+        self.assertEqual(
+            _parse_cls_times(df, "cls"),
+            [datetime(2026, 10, 15, 4, 0, tzinfo=timezone.utc), None, None, None],
+        )
+
+    def test_missing_columns(self):
+        df = pd.DataFrame({"发布日期": ["2026-10-15"], "标题": ["x"]})
+        self.assertEqual(_parse_cls_times(df, "cls"), [None])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, patch
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+import app.services  # noqa: F401  # app.services must load before the manager (import cycle)
+from app.collectors import rss_collector
+from app.collectors.manager import CollectorManager
+from app.collectors.rss_collector import GenericRSSCollector
+from app.database import Base
+from app.models.news import CollectionLog
+
+TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+FEED_URL = "https://example.com/feed.xml"
+# A stored non-empty batch always moves the checkpoint
+CHECKPOINT = datetime(2026, 10, 15, tzinfo=timezone.utc)
+FEED = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel>
+<item><title>Item one</title><link>https://example.com/1</link></item>
+</channel></rss>"""
+
+
+class _FakeCollector(GenericRSSCollector):
+    source_name = "fake_rss"
+    rss_url = FEED_URL
+
+
+class _FakeResponse:
+    def __init__(self, status_code: int, headers: dict | None = None, content: bytes = b""):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.content = content
+
+
+class _FakeFeedServer:
+    """Answers 304 when the client already holds the current ETag."""
+
+    def __init__(self):
+        self.requests: list[dict] = []
+
+    async def __call__(self, method, url, *, headers, **kwargs):
+        self.requests.append(headers)
+        if headers.get("If-None-Match") == '"v1"':
+            return _FakeResponse(304)
+        return _FakeResponse(200, {"etag": '"v1"'}, FEED)
+
+
+class TestConditionalGetValidators(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.engine = create_async_engine(TEST_DATABASE_URL)
+        async with self.engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        self.session_maker = async_sessionmaker(
+            self.engine, class_=AsyncSession, expire_on_commit=False
+        )
+
+        rss_collector._feed_cache.clear()
+        self.addCleanup(rss_collector._feed_cache.clear)
+        self.server = _FakeFeedServer()
+        for target, value in (
+            ("app.utils.http_client.request_async", self.server),
+            ("app.collectors.manager.get_collector", lambda name: _FakeCollector),
+        ):
+            patcher = patch(target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def asyncTearDown(self):
+        await self.engine.dispose()
+
+    async def _poll(self, persist: AsyncMock) -> list:
+        async with self.session_maker() as db:
+            manager = CollectorManager(db)
+            manager.persistence.persist_articles = persist
+            return await manager.collect_from(_FakeCollector.source_name)
+
+    async def _statuses(self) -> list[str]:
+        async with self.session_maker() as db:
+            result = await db.execute(
+                select(CollectionLog.status).order_by(CollectionLog.started_at)
+            )
+            return list(result.scalars())
+
+    async def test_failed_persist_is_retried_instead_of_answered_with_304(self):
+        failing = AsyncMock(side_effect=RuntimeError("db down"))
+        self.assertEqual(await self._poll(failing), [])
+        self.assertNotIn(FEED_URL, rss_collector._feed_cache)
+
+        # The feed has not changed, but the failed batch must be fetched again
+        persist = AsyncMock(return_value=(["stored"], 0, CHECKPOINT))
+        self.assertEqual(await self._poll(persist), ["stored"])
+        self.assertNotIn("If-None-Match", self.server.requests[1])
+        (call,) = persist.await_args_list
+        self.assertEqual(
+            [a.url for a in call.kwargs["raw_articles"]], ["https://example.com/1"]
+        )
+        self.assertEqual(rss_collector._feed_cache[FEED_URL], ('"v1"', None))
+
+        # Only a committed batch makes the next poll conditional
+        unchanged = AsyncMock()
+        self.assertEqual(await self._poll(unchanged), [])
+        self.assertEqual(self.server.requests[2]["If-None-Match"], '"v1"')
+        unchanged.assert_not_awaited()
+
+        self.assertEqual(await self._statuses(), ["failed", "success", "success"])
+
+    async def test_not_modified_without_committed_checkpoint_is_not_a_success(self):
+        # Validators left over from a batch that is no longer stored
+        rss_collector._feed_cache[FEED_URL] = ('"v1"', None)
+
+        unchanged = AsyncMock()
+        self.assertEqual(await self._poll(unchanged), [])
+        self.assertEqual(self.server.requests[0]["If-None-Match"], '"v1"')
+        unchanged.assert_not_awaited()
+        self.assertEqual(await self._statuses(), [])
+        self.assertNotIn(FEED_URL, rss_collector._feed_cache)
+
+        persist = AsyncMock(return_value=(["stored"], 0, CHECKPOINT))
+        self.assertEqual(await self._poll(persist), ["stored"])
+        self.assertNotIn("If-None-Match", self.server.requests[1])
+        self.assertEqual(await self._statuses(), ["success"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+import unittest
+
+from app.collectors.rss_parsers import _strip_tags
+
+
+class TestStripTags(unittest.TestCase):
+    CASES = [
+        # (description, text, limit, expected)
+        ("nested tags", "<div><p>Hello <b><i>world</i></b></p></div>", 1000, "Hello world"),
+        ("lone < is kept", "a < b and c", 1000, "a < b and c"),
+        ("< ... > without a tag name is text", "1 < 2 > 0", 1000, "1 < 2 > 0"),
+        ("unclosed tag at end", "<p>unclosed <b", 1000, "unclosed "),
+        ("numeric entities", "&#8220;quoted&#8221; &#x4e2d;&#X6587;", 1000, "“quoted” 中文"),
+        ("named entities", "A &amp; B &nbsp;x", 1000, "A & B \xa0x"),
+        ("escaped markup stays text", "&lt;script&gt;alert(1)&lt;/script&gt;", 1000, "<script>alert(1)</script>"),
+        ("script and style elements are dropped", "a<script>x()</script>b<style>p{}</style>c", 1000, "abc"),
+        ("bare ampersands", "fish &amp chips &", 1000, "fish & chips &"),
+        ("entity without semicolon at end", "price &#82", 1000, "price R"),
+        ("truncate after decoding", "abc&amp;def", 4, "abc&"),
+        ("tags do not count towards the limit", "a" * 5 + "<b>bold</b> " + "c" * 20, 10, "aaaaabold "),
+        ("empty", "", 10, ""),
+    ]
+
+    def test_strip_tags(self):
+        for description, text, limit, expected in self.CASES:
+            with self.subTest(description):
+                self.assertEqual(_strip_tags(text, limit), expected)
+
+    def test_default_limit_truncates_long_html(self):
+        text = "<p>" + "段落&amp;" * 2000 + "</p>"
+        self.assertEqual(_strip_tags(text), ("段落&" * 2000)[:1000])
+
+
+if __name__ == "__main__":
+    unittest.main()
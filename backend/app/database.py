@@ -10,6 +10,14 @@ engine = create_async_engine(
     pool_pre_ping=True,
     pool_size=5,
     max_overflow=10,
+    # 同一语句只编译一次（SQL 字符串级缓存）
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+    # asyncpg 方言按连接缓存 prepare 结果，热点查询免去重复 Parse/Plan
+    connect_args=(
+        {"prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE}
+        if settings.DATABASE_URL.startswith("postgresql+asyncpg")
+        else {}
+    ),
 )
 
 async_session_maker = async_sessionmaker(
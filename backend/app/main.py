@@ -6,9 +6,16 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from app.api import router
 from app.config import settings
-from app.database import init_db
+from app.database import init_db, async_session_maker
 from app.services.scheduler import start_scheduler, stop_scheduler
+from app.services.notifications import NewArticleListener
+from app.services.dedup import invalidate_known_keys
+from app.services.news_service import invalidate_total_cache
+from app.services.stats_service import invalidate_meta_cache
+from app.services.stream_service import StreamBroadcaster, StreamService
 from app.middleware.error_handler import register_error_handlers
+from app.utils.executor import shutdown_executor
+from app.utils.http_client import close_async_clients, close_clients
 
 # Configure logging
 logging.basicConfig(
@@ -17,6 +24,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+new_article_listener = NewArticleListener(async_session_maker)
+stream_broadcaster = StreamBroadcaster(async_session_maker)
+stream_service = StreamService(async_session_maker, stream_broadcaster)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -25,6 +36,14 @@ async def lifespan(app: FastAPI):
     logger.info(f"Starting {settings.APP_NAME}")
     await init_db()
 
+    app.state.stream_service = stream_service
+    stream_broadcaster.start()
+    new_article_listener.subscribe(invalidate_meta_cache)
+    new_article_listener.subscribe(invalidate_total_cache)
+    new_article_listener.subscribe(invalidate_known_keys)
+    new_article_listener.subscribe(stream_broadcaster.notify)
+    new_article_listener.start()
+
     # Only start scheduler if not disabled
     if not settings.DISABLE_SCHEDULER:
         logger.info("Starting news collection scheduler...")
@@ -35,8 +54,17 @@ async def lifespan(app: FastAPI):
     yield
 
     # Shutdown
+    await new_article_listener.stop()
+    new_article_listener.unsubscribe(stream_broadcaster.notify)
+    new_article_listener.unsubscribe(invalidate_known_keys)
+    new_article_listener.unsubscribe(invalidate_total_cache)
+    new_article_listener.unsubscribe(invalidate_meta_cache)
+    await stream_broadcaster.stop()
     if not settings.DISABLE_SCHEDULER:
         stop_scheduler()
+    close_clients()
+    await close_async_clients()
+    shutdown_executor()
     logger.info("Application shutdown complete")
 
 
@@ -1,16 +1,17 @@
 import uuid
 from datetime import datetime, timezone
-from sqlalchemy import String, Text, Boolean, Float, Integer, Index, text, JSON
+from sqlalchemy import String, Text, Boolean, Float, Integer, Index, LargeBinary, text, JSON
 from sqlalchemy.dialects.postgresql import UUID, JSONB, TIMESTAMP
 from sqlalchemy.orm import Mapped, mapped_column
 from app.database import Base
+from app.utils.ids import uuid7
 
 
 class NewsArticle(Base):
     __tablename__ = "news_articles"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
 
     # Content fields
@@ -34,7 +35,10 @@ class NewsArticle(Base):
     )
 
     # Deduplication
-    content_hash: Mapped[str] = mapped_column(String(64), unique=True, nullable=False)
+    # SHA-256 原始 32 字节，比 64 位十六进制串省一半存储与比较开销
+    content_hash: Mapped[bytes] = mapped_column(
+        LargeBinary(32), unique=True, nullable=False
+    )
     similarity_group_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True), nullable=True
     )
@@ -60,7 +64,50 @@ class NewsArticle(Base):
     __table_args__ = (
         Index("idx_news_published_at", "published_at", postgresql_using="btree"),
         Index("idx_news_source", "source"),
-        Index("idx_news_content_hash", "content_hash"),
+        Index(
+            "idx_news_published_id",
+            "published_at",
+            "id",
+            postgresql_include=[
+                "source",
+                "source_category",
+                "is_read",
+                "is_starred",
+                "collected_at",
+            ],
+            postgresql_where=text("NOT is_filtered"),
+        ),
+        Index(
+            "idx_news_source_published_id",
+            "source",
+            "published_at",
+            "id",
+            postgresql_where=text("NOT is_filtered"),
+        ),
+        Index(
+            "idx_news_starred_published_id",
+            "published_at",
+            "id",
+            postgresql_where=text("is_starred AND NOT is_filtered"),
+        ),
+        Index(
+            "idx_news_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+            postgresql_where=text("NOT is_filtered"),
+        ),
+        Index(
+            "idx_news_collected_id",
+            "collected_at",
+            "id",
+            postgresql_where=text("NOT is_filtered"),
+        ),
+        Index(
+            "idx_news_unread",
+            "source",
+            postgresql_where=text("NOT is_read"),
+        ),
     )
 
 
@@ -1,8 +1,9 @@
 from datetime import date, datetime
 from uuid import UUID
 
-from sqlalchemy import select, func, update, delete
+from sqlalchemy import select, func, update, delete, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 
 from app.models.news import NewsArticle
 from app.utils.timezone import local_day_bounds_utc
@@ -24,8 +25,14 @@ class NewsRepository:
         starred_only: bool,
         unread_only: bool,
         tz_name_for_published_date: str,
-    ) -> tuple[list[NewsArticle], int]:
-        query = select(NewsArticle).where(NewsArticle.is_filtered == False)
+        cursor: tuple[datetime, UUID] | None = None,
+        include_total: bool = True,
+    ) -> tuple[list[NewsArticle], int | None, tuple[datetime, UUID] | None]:
+        # 先只在 idx_news_published_id（INCLUDE 过滤列）上定位本页 id，
+        # 过滤、排序、计数均可走 index-only scan；再按 id 回表取整行
+        query = select(NewsArticle.id, NewsArticle.published_at).where(
+            NewsArticle.is_filtered == False
+        )
 
         if source:
             query = query.where(NewsArticle.source == source)
@@ -42,21 +49,77 @@ class NewsRepository:
         if unread_only:
             query = query.where(NewsArticle.is_read == False)
 
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await self._db.execute(count_query)
-        total = int(total_result.scalar_one() or 0)
+        page_query = query.order_by(NewsArticle.published_at.desc(), NewsArticle.id.desc())
+        if cursor is not None:
+            # keyset 分页：从游标位置继续，不再扫描并丢弃前面的行
+            cursor_published_at, cursor_id = cursor
+            page_query = page_query.where(
+                tuple_(NewsArticle.published_at, NewsArticle.id)
+                < tuple_(cursor_published_at, cursor_id)
+            )
+        else:
+            page_query = page_query.offset((page - 1) * per_page)
+
+        # 无游标时总数随分页查询一起通过窗口函数返回，避免二次执行过滤条件
+        window_total = include_total and cursor is None
+        if window_total:
+            page_query = page_query.add_columns(func.count().over().label("total"))
+
+        # 多取一行用于判断是否还有下一页
+        page_ids = page_query.limit(per_page + 1).subquery()
+        columns = [NewsArticle, page_ids.c.total] if window_total else [NewsArticle]
+        # 列表不返回正文，content 不取；误访问时直接报错而不是隐式再查一次
+        result = await self._db.execute(
+            select(*columns)
+            .join(page_ids, NewsArticle.id == page_ids.c.id)
+            .options(defer(NewsArticle.content, raiseload=True))
+            .order_by(page_ids.c.published_at.desc(), page_ids.c.id.desc())
+        )
+
+        total = None
+        if window_total:
+            rows = result.all()
+            items = [row[0] for row in rows]
+            if rows:
+                total = int(rows[0].total)
+            elif page == 1:
+                total = 0
+        else:
+            items = list(result.scalars().all())
 
-        page_query = query.order_by(NewsArticle.published_at.desc())
-        page_query = page_query.offset((page - 1) * per_page).limit(per_page)
-        result = await self._db.execute(page_query)
-        items = list(result.scalars().all())
+        # 游标（keyset）分页不计总数：每翻一页都全量 count 会抵消 keyset 的收益
+        if include_total and total is None and cursor is None:
+            total = await self._count(query)
 
-        return items, total
+        next_cursor = None
+        if len(items) > per_page:
+            items = items[:per_page]
+            next_cursor = (items[-1].published_at, items[-1].id)
+
+        return items, total, next_cursor
+
+    async def _count(self, query) -> int:
+        count_query = select(func.count()).select_from(query.subquery())
+        total_result = await self._db.execute(count_query)
+        return int(total_result.scalar_one() or 0)
 
     async def get_article_by_id(self, article_id: UUID) -> NewsArticle | None:
         result = await self._db.execute(select(NewsArticle).where(NewsArticle.id == article_id))
         return result.scalar_one_or_none()
 
+    async def update_fields(self, article_id: UUID, **values) -> NewsArticle | None:
+        stmt = (
+            update(NewsArticle)
+            .where(NewsArticle.id == article_id)
+            .values(**values)
+            .returning(NewsArticle)
+            .execution_options(populate_existing=True)
+        )
+        result = await self._db.execute(stmt)
+        article = result.scalar_one_or_none()
+        await self._db.commit()
+        return article
+
     async def mark_all_as_read(self, *, source: str | None) -> int:
         stmt = update(NewsArticle).where(NewsArticle.is_read == False)
         if source:
@@ -66,12 +129,33 @@ class NewsRepository:
         await self._db.commit()
         return result.rowcount or 0
 
-    async def purge_before(self, *, cutoff_utc: datetime, keep_starred: bool = True) -> int:
+    async def purge_before(
+        self,
+        *,
+        cutoff_utc: datetime,
+        keep_starred: bool = True,
+        batch_size: int = 5000,
+    ) -> int:
         conditions = [NewsArticle.published_at < cutoff_utc]
         if keep_starred:
             conditions.append(NewsArticle.is_starred == False)
 
-        stmt = delete(NewsArticle).where(*conditions)
-        result = await self._db.execute(stmt)
-        await self._db.commit()
-        return result.rowcount or 0
+        # 分批删除并逐批提交：单个事务的锁与 WAL 量有上限，不会长时间阻塞采集入库；
+        # 被其他事务锁住的行跳过，留到下次清理。
+        # 每批提交时 DELETE 语句级触发器发出 NOTIFY，各进程的计数缓存随之失效
+        deleted = 0
+        while True:
+            batch_ids = (
+                select(NewsArticle.id)
+                .where(*conditions)
+                .limit(batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            result = await self._db.execute(
+                delete(NewsArticle).where(NewsArticle.id.in_(batch_ids))
+            )
+            await self._db.commit()
+            count = result.rowcount or 0
+            deleted += count
+            if count < batch_size:
+                return deleted
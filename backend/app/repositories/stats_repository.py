@@ -9,29 +9,21 @@ class StatsRepository:
         self._db = db
 
     async def overview(self) -> dict:
-        total_result = await self._db.execute(select(func.count(NewsArticle.id)))
-        total = int(total_result.scalar_one() or 0)
-
-        unread_result = await self._db.execute(
-            select(func.count(NewsArticle.id)).where(NewsArticle.is_read == False)
-        )
-        unread = int(unread_result.scalar_one() or 0)
-
-        starred_result = await self._db.execute(
-            select(func.count(NewsArticle.id)).where(NewsArticle.is_starred == True)
-        )
-        starred = int(starred_result.scalar_one() or 0)
-
-        filtered_result = await self._db.execute(
-            select(func.count(NewsArticle.id)).where(NewsArticle.is_filtered == True)
+        result = await self._db.execute(
+            select(
+                func.count(NewsArticle.id).label("total"),
+                func.count().filter(NewsArticle.is_read == False).label("unread"),
+                func.count().filter(NewsArticle.is_starred == True).label("starred"),
+                func.count().filter(NewsArticle.is_filtered == True).label("filtered"),
+            )
         )
-        filtered = int(filtered_result.scalar_one() or 0)
+        row = result.one()
 
         return {
-            "total_articles": total,
-            "unread": unread,
-            "starred": starred,
-            "filtered": filtered,
+            "total_articles": int(row.total or 0),
+            "unread": int(row.unread or 0),
+            "starred": int(row.starred or 0),
+            "filtered": int(row.filtered or 0),
         }
 
     async def sources_with_counts(self) -> list[dict]:
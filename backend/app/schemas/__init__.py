@@ -1,5 +1,6 @@
 from app.schemas.news import (
     NewsArticleCreate,
+    NewsArticleListResponse,
     NewsArticleResponse,
     NewsArticleUpdate,
     PaginatedNews,
@@ -8,6 +9,7 @@ from app.schemas.news import (
 
 __all__ = [
     "NewsArticleCreate",
+    "NewsArticleListResponse",
     "NewsArticleResponse",
     "NewsArticleUpdate",
     "PaginatedNews",
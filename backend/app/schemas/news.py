@@ -1,11 +1,10 @@
 from datetime import datetime
 from uuid import UUID
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, field_validator
 
 
-class NewsArticleBase(BaseModel):
+class NewsArticleFields(BaseModel):
     title: str = Field(..., max_length=500)
-    content: str | None = None
     summary: str | None = Field(None, max_length=1000)
     url: str = Field(..., max_length=2000)
     source: str = Field(..., max_length=100)
@@ -13,6 +12,10 @@ class NewsArticleBase(BaseModel):
     published_at: datetime
 
 
+class NewsArticleBase(NewsArticleFields):
+    content: str | None = None
+
+
 class NewsArticleCreate(NewsArticleBase):
     content_hash: str = Field(..., max_length=64)
 
@@ -22,7 +25,9 @@ class NewsArticleUpdate(BaseModel):
     is_starred: bool | None = None
 
 
-class NewsArticleResponse(NewsArticleBase):
+class NewsArticleListResponse(NewsArticleFields):
+    """列表项：不含正文 content（列表页不展示，查询时也不读取）"""
+
     model_config = ConfigDict(from_attributes=True)
 
     id: UUID
@@ -34,13 +39,26 @@ class NewsArticleResponse(NewsArticleBase):
     is_filtered: bool = False
     created_at: datetime
 
+    @field_validator("content_hash", mode="before")
+    @classmethod
+    def _hex_content_hash(cls, value):
+        # 数据库中存原始字节，对外仍输出十六进制字符串
+        if isinstance(value, (bytes, memoryview)):
+            return bytes(value).hex()
+        return value
+
+
+class NewsArticleResponse(NewsArticleListResponse):
+    content: str | None = None
+
 
 class PaginatedNews(BaseModel):
-    items: list[NewsArticleResponse]
-    total: int
+    items: list[NewsArticleListResponse]
+    total: int | None = None
     page: int
     per_page: int
-    pages: int
+    pages: int | None = None
+    next_cursor: str | None = None
 
 
 class CollectionLogResponse(BaseModel):
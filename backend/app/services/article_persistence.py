@@ -3,7 +3,7 @@ Article Persistence Service - 文章持久化服务
 
 职责：
 - 文章去重检查
-- 文章保存到数据库
+- 文章保存到数据库（每批一条 INSERT ... ON CONFLICT DO NOTHING）
 
 设计原则：
 - 单一职责：只处理持久化
@@ -12,11 +12,13 @@ Article Persistence Service - 文章持久化服务
 
 from datetime import datetime, timezone
 
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.collectors.base import RawArticle
 from app.models.news import NewsArticle
 from app.services.dedup import DeduplicationService
+from app.services.news_dedup.types import NewsText
 
 
 class ArticlePersistenceService:
@@ -44,8 +46,7 @@ class ArticlePersistenceService:
             tuple: (new_articles, duplicate_count, max_published_at)
         """
         collected_fallback_at = datetime.now(timezone.utc)
-        new_articles = []
-        duplicate_count = 0
+        candidates: list[tuple[RawArticle, str, datetime]] = []
         max_published_at = None
 
         for raw in raw_articles:
@@ -60,31 +61,62 @@ class ArticlePersistenceService:
                 continue
 
             # Skip empty titles
-            if not raw.title or not raw.title.strip():
+            title = raw.title.strip() if raw.title else ""
+            if not title:
                 continue
 
-            # Check for duplicates
-            is_dup, content_hash = await self.dedup.is_duplicate(
-                raw.url, raw.title, source_name, content=raw.content or "", summary=raw.summary or ""
-            )
-
+            candidates.append((raw, title, published_at))
+
+        # 整批去重：URL / 内容哈希一次查询，批内已接受的文章也参与比较；
+        # 返回的 content_hash 直接写入，不再重复计算
+        verdicts = await self.dedup.filter_duplicates(
+            [
+                (
+                    raw.url,
+                    NewsText(
+                        title=title,
+                        content=raw.content or "",
+                        summary=raw.summary or "",
+                    ),
+                )
+                for raw, title, _ in candidates
+            ],
+            source_name,
+        )
+
+        rows: list[dict] = []
+        duplicate_count = 0
+        for (raw, title, published_at), (is_dup, content_hash) in zip(
+            candidates, verdicts
+        ):
             if is_dup:
                 duplicate_count += 1
                 continue
 
-            # Create article
-            article = NewsArticle(
-                title=raw.title.strip(),
-                url=raw.url,
-                content=raw.content,
-                summary=raw.summary,
-                source=source_name,
-                source_category=raw.source_category,
-                published_at=published_at,
-                content_hash=content_hash,
+            rows.append(
+                {
+                    "title": title,
+                    "url": raw.url,
+                    "content": raw.content,
+                    "summary": raw.summary,
+                    "source": source_name,
+                    "source_category": raw.source_category,
+                    "published_at": published_at,
+                    "content_hash": content_hash,
+                }
             )
 
-            self.db.add(article)
-            new_articles.append(article)
+        if not rows:
+            return [], duplicate_count, max_published_at
+
+        # 一批一条语句；url / content_hash 唯一约束冲突的行（批内重复或并发写入）直接跳过
+        result = await self.db.scalars(
+            insert(NewsArticle)
+            .values(rows)
+            .on_conflict_do_nothing()
+            .returning(NewsArticle)
+        )
+        new_articles = list(result.all())
+        duplicate_count += len(rows) - len(new_articles)
 
         return new_articles, duplicate_count, max_published_at
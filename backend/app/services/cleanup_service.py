@@ -5,6 +5,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.cleanup import CleanupLog
 from app.repositories.news_repository import NewsRepository
+from app.services.dedup import invalidate_known_keys
+from app.services.news_service import invalidate_total_cache
+from app.services.stats_service import invalidate_meta_cache
 from app.utils.timezone import retention_cutoff_utc
 
 
@@ -14,7 +17,14 @@ class CleanupService:
         self._news_repo = NewsRepository(db)
 
     async def purge_old_news(self, cutoff_utc: datetime) -> int:
-        return await self._news_repo.purge_before(cutoff_utc=cutoff_utc, keep_starred=True)
+        deleted = await self._news_repo.purge_before(cutoff_utc=cutoff_utc, keep_starred=True)
+        # 每个已提交批次由删除触发器 NOTIFY，各进程随之失效缓存；
+        # 本进程再直接清一次，不依赖监听连接是否在线
+        invalidate_total_cache()
+        invalidate_meta_cache()
+        # 已删除文章的 URL/哈希不能再被当作重复
+        invalidate_known_keys()
+        return deleted
 
     async def create_cleanup_log(
         self,
@@ -54,15 +64,20 @@ class CleanupService:
         return result.scalars().first()
 
     async def get_cleanup_summary(self) -> dict:
-        latest = await self.get_latest_cleanup_log()
-
-        total_runs_result = await self.db.execute(select(func.count(CleanupLog.id)))
-        total_runs = int(total_runs_result.scalar_one() or 0)
-
-        total_deleted_result = await self.db.execute(
-            select(func.coalesce(func.sum(CleanupLog.deleted_count), 0))
+        # 最新一条日志与全表汇总一次查出：窗口聚合在 LIMIT 之前覆盖所有行
+        result = await self.db.execute(
+            select(
+                CleanupLog,
+                func.count().over().label("total_runs"),
+                func.sum(CleanupLog.deleted_count).over().label("total_deleted"),
+            )
+            .order_by(CleanupLog.started_at.desc())
+            .limit(1)
         )
-        total_deleted = int(total_deleted_result.scalar_one() or 0)
+        row = result.first()
+        latest = row[0] if row else None
+        total_runs = int(row.total_runs) if row else 0
+        total_deleted = int(row.total_deleted or 0) if row else 0
 
         last_duration_ms = None
         if latest and latest.finished_at:
@@ -15,11 +15,16 @@ class CollectionRunner:
         session_maker,
         max_concurrency: int,
         collector_timeout: int,
+        max_fetch_concurrency: int | None = None,
     ):
         self._session_maker = session_maker
         self._max_concurrency = max_concurrency
         self._collector_timeout = collector_timeout
         self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        # 未指定抓取并发时沿用 max_concurrency，抓取始终有上限
+        self._fetch_semaphore = asyncio.Semaphore(
+            max_fetch_concurrency or self._max_concurrency
+        )
         self._running_tasks: dict[str, asyncio.Task[list]] = {}
         self._last_window_started: dict[str, int] = {}
 
@@ -41,29 +46,29 @@ class CollectionRunner:
 
     async def _run_one(self, source_name: str) -> list:
         async with self._session_maker() as db:
-            manager = CollectorManager(db, log_session_maker=self._session_maker)
-            return await asyncio.wait_for(
-                manager.collect_from(source_name), timeout=self._collector_timeout
+            # 抓取与入库分别限流：max_concurrency 只限制入库阶段，
+            # 网络抓取由 max_fetch_concurrency 单独控制。
+            # 超时只计拿到名额后的抓取+入库时间，排队等待不计入
+            manager = CollectorManager(
+                db,
+                log_session_maker=self._session_maker,
+                fetch_semaphore=self._fetch_semaphore,
+                persist_semaphore=self._semaphore,
+                timeout=self._collector_timeout,
             )
+            return await manager.collect_from(source_name)
 
     async def _guarded_collect(self, source_name: str) -> list:
         loop = asyncio.get_running_loop()
         start = loop.time()
         try:
-            async with self._semaphore:
-                try:
-                    results = await self._run_one(source_name)
-                    duration_ms = int((loop.time() - start) * 1000)
-                    logger.info(
-                        f"Collector {source_name} finished: items={len(results)} duration_ms={duration_ms}"
-                    )
-                    return results
-                except asyncio.TimeoutError:
-                    duration_ms = int((loop.time() - start) * 1000)
-                    logger.warning(
-                        f"Collector {source_name} timed out after {self._collector_timeout}s duration_ms={duration_ms}"
-                    )
-                    return []
+            # 超时由 CollectorManager 处理：记录失败日志并返回空列表
+            results = await self._run_one(source_name)
+            duration_ms = int((loop.time() - start) * 1000)
+            logger.info(
+                f"Collector {source_name} finished: items={len(results)} duration_ms={duration_ms}"
+            )
+            return results
         except asyncio.CancelledError:
             duration_ms = int((loop.time() - start) * 1000)
             logger.warning(f"Collector {source_name} cancelled duration_ms={duration_ms}")
@@ -1,7 +1,9 @@
 import hashlib
 import re
+from collections import OrderedDict
+from collections.abc import Sequence
 from pathlib import Path
-from sqlalchemy import select
+from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
@@ -10,6 +12,38 @@ from app.services.news_dedup.advanced_deduplicator import AdvancedDedupConfig, A
 from app.services.news_dedup.chinese_synonym_engine import get_chinese_synonym_engine
 from app.services.news_dedup.types import NewsText
 
+# Title normalization runs once per candidate; keep the patterns compiled
+_TAG_BRACKETS_RE = re.compile(r"[【\[\(].*?[】\]\)]")
+_NON_WORD_RE = re.compile(r"[^\w\u4e00-\u9fff]")
+
+# Process-wide LRU of URLs / content hashes already confirmed to exist in the
+# database. Only rows returned by an existence query are recorded, never
+# candidates from an uncommitted batch, so a rolled-back insert cannot leave
+# a false "duplicate" behind.
+_known_keys: OrderedDict[str | bytes, None] = OrderedDict()
+
+
+def _remember_known(keys: Sequence[str | bytes]) -> None:
+    limit = settings.DEDUP_KNOWN_CACHE_SIZE
+    if limit <= 0:
+        return
+    for key in keys:
+        _known_keys[key] = None
+        _known_keys.move_to_end(key)
+    while len(_known_keys) > limit:
+        _known_keys.popitem(last=False)
+
+
+def invalidate_known_keys(payload: str | None = None) -> None:
+    """Forget every confirmed key once stored rows may have been deleted.
+
+    Also usable as a new-article listener callback: inserts only add keys,
+    so only delete notifications, and reconnects that may have missed one,
+    clear the cache.
+    """
+    if payload in (None, "deleted", "reconnected"):
+        _known_keys.clear()
+
 
 class DeduplicationService:
     """Three-layer deduplication strategy."""
@@ -24,7 +58,7 @@ class DeduplicationService:
         )
         return result.scalar_one_or_none() is not None
 
-    async def check_hash_exists(self, content_hash: str) -> bool:
+    async def check_hash_exists(self, content_hash: bytes) -> bool:
         """Layer 2: Content hash deduplication."""
         result = await self.db.execute(
             select(NewsArticle.id)
@@ -33,59 +67,147 @@ class DeduplicationService:
         )
         return result.scalar_one_or_none() is not None
 
-    def compute_content_hash(self, title: str, source: str) -> str:
-        """Compute content fingerprint for deduplication."""
+    def compute_content_hash(self, title: str, source: str) -> bytes:
+        """Compute content fingerprint (raw 32-byte SHA-256) for deduplication."""
         normalized = self._normalize_title(title)
-        return hashlib.sha256(f"{normalized}|{source}".encode()).hexdigest()
+        return hashlib.sha256(f"{normalized}|{source}".encode()).digest()
 
     def _normalize_title(self, title: str) -> str:
         """Normalize title: remove punctuation, spaces, convert to lowercase."""
         if not title:
             return ""
         # Remove common financial news tags like 【...】, [...], (口述), (图) etc.
-        title = re.sub(r"[【\[\(].*?[】\]\)]", "", title)
+        title = _TAG_BRACKETS_RE.sub("", title)
         # Remove all non-word characters except Chinese characters
         # \w matches [a-zA-Z0-9_]
-        title = re.sub(r"[^\w\u4e00-\u9fff]", "", title)
+        title = _NON_WORD_RE.sub("", title)
         return title.lower()
 
     async def is_duplicate(
-        self, url: str, title: str, source: str, content: str = "", summary: str = ""
-    ) -> tuple[bool, str]:
+        self,
+        url: str,
+        title: str,
+        source: str,
+        content: str = "",
+        summary: str = "",
+        pending: Sequence[NewsText] = (),
+    ) -> tuple[bool, bytes]:
         """
         Check if article is duplicate.
+        ``pending`` holds articles accepted earlier in the same batch
+        that are not in the database yet.
         Returns (is_duplicate, content_hash).
         """
-        if await self.check_url_exists(url):
-            return True, ""
+        current = NewsText(title=title, content=content or "", summary=summary or "")
+        (result,) = await self.filter_duplicates(
+            [(url, current)], source, pending=pending
+        )
+        return result
+
+    async def filter_duplicates(
+        self,
+        candidates: Sequence[tuple[str, NewsText]],
+        source: str,
+        pending: Sequence[NewsText] = (),
+    ) -> list[tuple[bool, bytes]]:
+        """
+        Check a whole batch of (url, text) candidates in order.
 
-        content_hash = self.compute_content_hash(title, source)
-        if await self.check_hash_exists(content_hash):
-            return True, content_hash
+        URL and content-hash lookups for the batch share one query and the
+        recent articles for semantic comparison are loaded once. Candidates
+        accepted earlier in the batch count as existing for later ones.
+        Returns one (is_duplicate, content_hash) per candidate; the hash is
+        empty for URL hits, as with ``is_duplicate``.
+        """
+        if not candidates:
+            return []
 
-        similar_articles = await self.find_similar_articles(
-            NewsText(title=title, content=content or "", summary=summary or "")
+        hashes = [
+            self.compute_content_hash(text.title, source) for _, text in candidates
+        ]
+        seen_urls, seen_hashes = await self.find_existing(
+            [url for url, _ in candidates], hashes
         )
-        if similar_articles:
-            return True, content_hash
+        accepted = list(pending)
+        recent: list[NewsText] | None = None
+        deduplicator: AdvancedDeduplicator | None = None
 
-        return False, content_hash
+        results: list[tuple[bool, bytes]] = []
+        for (url, current), content_hash in zip(candidates, hashes):
+            if url in seen_urls:
+                results.append((True, b""))
+                continue
+            if content_hash in seen_hashes:
+                results.append((True, content_hash))
+                continue
 
-    async def find_similar_articles(
-        self, current: NewsText
-    ) -> list[NewsArticle]:
-        """
-        Layer 3: Semantic similarity deduplication (cross-source).
-        Uses semantic elements and synonym-enhanced similarity.
+            if recent is None:
+                recent = await self._load_recent_texts()
+                deduplicator = self._build_deduplicator()
+            if any(
+                deduplicator.compare(current, candidate).is_duplicate
+                for candidate in (*accepted, *recent)
+            ):
+                results.append((True, content_hash))
+                continue
+
+            results.append((False, content_hash))
+            accepted.append(current)
+            seen_urls.add(url)
+            seen_hashes.add(content_hash)
+
+        return results
+
+    async def find_existing(
+        self, urls: Sequence[str], hashes: Sequence[bytes]
+    ) -> tuple[set[str], set[bytes]]:
+        """Layers 1+2 in one round trip: which URLs / content hashes already exist.
+
+        Keys seen in an earlier lookup are answered from the in-process
+        cache; the database is only queried for the rest.
         """
+        existing_urls = {url for url in urls if url in _known_keys}
+        existing_hashes = {h for h in hashes if h in _known_keys}
+        for key in (*existing_urls, *existing_hashes):
+            _known_keys.move_to_end(key)
+
+        url_set = set(urls) - existing_urls
+        hash_set = set(hashes) - existing_hashes
+        if not url_set and not hash_set:
+            return existing_urls, existing_hashes
+
+        result = await self.db.execute(
+            select(NewsArticle.url, NewsArticle.content_hash).where(
+                or_(
+                    NewsArticle.url.in_(url_set),
+                    NewsArticle.content_hash.in_(hash_set),
+                )
+            )
+        )
+        found: list[str | bytes] = []
+        for url, content_hash in result.all():
+            if url in url_set:
+                existing_urls.add(url)
+            if content_hash in hash_set:
+                existing_hashes.add(content_hash)
+            found.extend((url, content_hash))
+        _remember_known(found)
+        return existing_urls, existing_hashes
+
+    async def _load_recent_texts(self) -> list[NewsText]:
+        """Most recent articles used as Layer 3 comparison candidates."""
         recent_limit = max(1, int(settings.DEDUP_RECENT_LIMIT))
         result = await self.db.execute(
-            select(NewsArticle)
+            select(NewsArticle.title, NewsArticle.content, NewsArticle.summary)
             .order_by(NewsArticle.published_at.desc())
             .limit(recent_limit)
         )
-        recent_articles = result.scalars().all()
-        
+        return [
+            NewsText(title=title, content=content or "", summary=summary or "")
+            for title, content, summary in result.all()
+        ]
+
+    def _build_deduplicator(self) -> AdvancedDeduplicator:
         synonym_engine = None
         if settings.DEDUP_ENABLE_SYNONYMS:
             data_dir = (
@@ -97,7 +219,7 @@ class DeduplicationService:
                 str(data_dir), preferred_source=settings.DEDUP_SYNONYM_SOURCE
             )
 
-        deduplicator = AdvancedDeduplicator(
+        return AdvancedDeduplicator(
             AdvancedDedupConfig(
                 semantic_threshold=float(settings.DEDUP_SEMANTIC_THRESHOLD),
                 synonym_threshold=float(settings.DEDUP_SYNONYM_THRESHOLD),
@@ -107,6 +229,23 @@ class DeduplicationService:
             synonym_engine=synonym_engine,
         )
 
+    async def find_similar_articles(
+        self, current: NewsText
+    ) -> list[NewsArticle]:
+        """
+        Layer 3: Semantic similarity deduplication (cross-source).
+        Uses semantic elements and synonym-enhanced similarity.
+        """
+        recent_limit = max(1, int(settings.DEDUP_RECENT_LIMIT))
+        result = await self.db.execute(
+            select(NewsArticle)
+            .order_by(NewsArticle.published_at.desc())
+            .limit(recent_limit)
+        )
+        recent_articles = result.scalars().all()
+
+        deduplicator = self._build_deduplicator()
+
         for article in recent_articles:
             candidate = NewsText(
                 title=article.title,
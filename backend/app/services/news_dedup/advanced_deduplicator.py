@@ -85,7 +85,7 @@ class AdvancedDeduplicator:
 
     def exact_fingerprint(self, text: str) -> str:
         normalized = self._normalize_text(text)
-        return hashlib.md5(normalized.encode("utf-8")).hexdigest()
+        return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
 
     def semantic_fingerprint(self, text: str) -> str:
         elements = self._extract_semantic_elements(text)
@@ -93,7 +93,7 @@ class AdvancedDeduplicator:
         for category in ("companies", "actions", "numbers", "themes"):
             values = ",".join(elements.get(category, ()))
             flattened.append(f"{category}:{values}")
-        return hashlib.md5("|".join(flattened).encode("utf-8")).hexdigest()
+        return hashlib.blake2b("|".join(flattened).encode("utf-8"), digest_size=16).hexdigest()
 
     def _combine_text(self, news: NewsText) -> str:
         parts = [news.title, news.summary, news.content]
@@ -20,6 +20,20 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.news import NewsArticle
 from app.config import settings
 from app.repositories.news_repository import NewsRepository
+from app.services.dedup import invalidate_known_keys
+from app.services.stats_service import invalidate_meta_cache
+from app.utils.cache import TTLCache
+
+# 按筛选条件缓存列表总数：命中时分页查询不再带 count(*) OVER ()，
+# 可在取够一页后停止扫描。新文章通知、状态更新、清理时整体失效
+_total_cache = TTLCache(
+    ttl_seconds=settings.NEWS_TOTAL_CACHE_TTL_SECONDS, max_entries=1024
+)
+
+
+def invalidate_total_cache(_payload: str | None = None) -> None:
+    """清空列表总数缓存，可直接作为新文章通知回调"""
+    _total_cache.clear()
 
 
 class NewsService:
@@ -39,16 +53,34 @@ class NewsService:
         published_date: date | None = None,
         starred_only: bool = False,
         unread_only: bool = False,
-    ) -> tuple[list[NewsArticle], int]:
+        cursor: tuple[datetime, UUID] | None = None,
+        include_total: bool = True,
+    ) -> tuple[list[NewsArticle], int | None, tuple[datetime, UUID] | None]:
         """
         获取分页新闻列表
 
+        Args:
+            cursor: keyset 游标 (published_at, id)，提供时忽略 page
+            include_total: 是否返回总数；游标分页时只返回缓存中的总数
+
         Returns:
-            tuple: (articles, total_count)
+            tuple: (articles, total_count, next_cursor)
         """
         if per_page is None:
             per_page = settings.DEFAULT_PAGE_SIZE
-        return await self._repo.get_paginated_news(
+
+        # 缓存键只含筛选条件，与页码、游标无关：同一筛选下的各页共用一个总数。
+        # 游标分页仓储层不计数，只能从缓存取，未命中时总数为 None
+        cache_key = None
+        cached_total = None
+        use_cache = settings.NEWS_TOTAL_CACHE_TTL_SECONDS > 0
+        if include_total and use_cache:
+            cache_key = repr(
+                (source, category, search, published_date, starred_only, unread_only)
+            )
+            cached_total = _total_cache.get(cache_key)
+
+        items, total, next_cursor = await self._repo.get_paginated_news(
             page=page,
             per_page=per_page,
             source=source,
@@ -58,8 +90,16 @@ class NewsService:
             starred_only=starred_only,
             unread_only=unread_only,
             tz_name_for_published_date="Asia/Shanghai",
+            cursor=cursor,
+            include_total=include_total and cached_total is None,
         )
 
+        if cached_total is not None:
+            total = cached_total
+        elif cache_key is not None and total is not None:
+            _total_cache.set(cache_key, total)
+        return items, total, next_cursor
+
     async def get_article_by_id(self, article_id: UUID) -> NewsArticle | None:
         """根据ID获取单篇文章"""
         return await self._repo.get_article_by_id(article_id)
@@ -76,17 +116,18 @@ class NewsService:
         Returns:
             更新后的文章，如果不存在返回None
         """
-        article = await self.get_article_by_id(article_id)
-        if not article:
-            return None
-
+        values = {}
         if is_read is not None:
-            article.is_read = is_read
+            values["is_read"] = is_read
         if is_starred is not None:
-            article.is_starred = is_starred
+            values["is_starred"] = is_starred
+
+        if not values:
+            return await self.get_article_by_id(article_id)
 
-        await self.db.commit()
-        await self.db.refresh(article)
+        # 单条 UPDATE ... RETURNING 完成更新并取回最新行
+        article = await self._repo.update_fields(article_id, **values)
+        invalidate_total_cache()
         return article
 
     async def mark_all_as_read(self, source: str | None = None) -> int:
@@ -99,7 +140,13 @@ class NewsService:
         Returns:
             受影响的文章数量
         """
-        return await self._repo.mark_all_as_read(source=source)
+        count = await self._repo.mark_all_as_read(source=source)
+        invalidate_total_cache()
+        return count
 
     async def purge_old_news(self, cutoff_utc: datetime) -> int:
-        return await self._repo.purge_before(cutoff_utc=cutoff_utc, keep_starred=True)
+        deleted = await self._repo.purge_before(cutoff_utc=cutoff_utc, keep_starred=True)
+        invalidate_total_cache()
+        invalidate_meta_cache()
+        invalidate_known_keys()
+        return deleted
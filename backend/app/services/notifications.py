@@ -0,0 +1,110 @@
+"""
+Notification Service - 数据库通知监听
+
+职责：
+- 维护唯一的 LISTEN new_article 连接
+- 将新文章/删除文章通知分发给进程内订阅者
+
+设计原则：
+- 每个进程只占用一个监听连接，与订阅者数量无关
+- 连接断开后自动重连；定期 SELECT 1 探活，静默断线（无 RST）也能发现
+- 重连后补发一次通知，订阅者据此补齐断线期间可能漏掉的变化
+"""
+
+import asyncio
+import logging
+from typing import Callable
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+logger = logging.getLogger(__name__)
+
+# 与 alembic 002_news_article_notify（插入）和
+# 011_news_article_delete_notify（删除，payload 为 "deleted"）中的触发器保持一致
+NEW_ARTICLE_CHANNEL = "new_article"
+
+
+class NewArticleListener:
+    """新文章通知监听器"""
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker,
+        *,
+        channel: str = NEW_ARTICLE_CHANNEL,
+        reconnect_delay: float = 5.0,
+        ping_interval: float = 30.0,
+        ping_timeout: float = 10.0,
+    ):
+        self._session_maker = session_maker
+        self._channel = channel
+        self._reconnect_delay = reconnect_delay
+        self._ping_interval = ping_interval
+        self._ping_timeout = ping_timeout
+        self._callbacks: list[Callable[[str], None]] = []
+        self._task: asyncio.Task | None = None
+
+    def subscribe(self, callback: Callable[[str], None]) -> None:
+        self._callbacks.append(callback)
+
+    def unsubscribe(self, callback: Callable[[str], None]) -> None:
+        try:
+            self._callbacks.remove(callback)
+        except ValueError:
+            pass
+
+    def _dispatch(self, _conn, _pid, _channel, payload: str) -> None:
+        for callback in list(self._callbacks):
+            try:
+                callback(payload)
+            except Exception as e:
+                logger.error(f"New article callback failed: {e}")
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._listen()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"LISTEN {self._channel} connection lost: {e!r}")
+            await asyncio.sleep(self._reconnect_delay)
+
+    async def _listen(self) -> None:
+        # 处于事务中的连接不会收到 NOTIFY，因此使用 AUTOCOMMIT
+        async with self._session_maker() as db:
+            conn = await db.connection(execution_options={"isolation_level": "AUTOCOMMIT"})
+            raw_conn = await conn.get_raw_connection()
+            driver_conn = raw_conn.driver_connection
+            await driver_conn.add_listener(self._channel, self._dispatch)
+            logger.info(f"Listening on channel {self._channel}")
+            # 未监听期间的通知已丢失，通知订阅者失效缓存/补查一次
+            self._dispatch(None, None, self._channel, "reconnected")
+            try:
+                while not driver_conn.is_closed():
+                    await asyncio.sleep(self._ping_interval)
+                    # 连接被静默断开时 is_closed() 仍为 False，需主动探活
+                    await asyncio.wait_for(
+                        driver_conn.execute("SELECT 1"), timeout=self._ping_timeout
+                    )
+            except Exception:
+                # 探活失败或超时，连接已不可用：直接作废，避免 UNLISTEN/归还连接池时再次阻塞
+                await conn.invalidate()
+                raise
+            finally:
+                if not driver_conn.is_closed():
+                    await driver_conn.remove_listener(self._channel, self._dispatch)
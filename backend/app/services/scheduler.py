@@ -36,11 +36,12 @@ scheduler = AsyncIOScheduler(
 _scheduler_started = False
 
 # Timeout for each individual collector (seconds)
-COLLECTOR_TIMEOUT = 30
+COLLECTOR_TIMEOUT = settings.COLLECTOR_TIMEOUT_SECONDS
 _runner = CollectionRunner(
     session_maker=async_session_maker,
     max_concurrency=settings.COLLECTION_MAX_CONCURRENCY,
     collector_timeout=COLLECTOR_TIMEOUT,
+    max_fetch_concurrency=settings.COLLECTION_MAX_CONCURRENT_FETCHES,
 )
 
 
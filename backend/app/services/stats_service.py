@@ -13,8 +13,19 @@ Stats Service - 统计与元数据服务
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.models.news import CollectionLog
 from app.repositories.stats_repository import StatsRepository
+from app.utils.cache import TTLCache
+
+# 来源/分类聚合只在采集入库和清理删除时变化，缓存结果并在
+# new_article 频道的插入/删除通知（各进程都会收到）时清空
+_meta_cache = TTLCache(ttl_seconds=settings.STATS_CACHE_TTL_SECONDS)
+
+
+def invalidate_meta_cache(_payload: str | None = None) -> None:
+    """清空来源/分类缓存，可直接作为新文章通知回调"""
+    _meta_cache.clear()
 
 
 class StatsService:
@@ -40,7 +51,11 @@ class StatsService:
         Returns:
             list: [{"source": "xxx", "count": 123}, ...]
         """
-        return await self._repo.sources_with_counts()
+        cached = _meta_cache.get("sources")
+        if cached is None:
+            cached = await self._repo.sources_with_counts()
+            _meta_cache.set("sources", cached)
+        return cached
 
     async def get_categories_with_counts(self) -> list[dict]:
         """
@@ -49,7 +64,11 @@ class StatsService:
         Returns:
             list: [{"category": "xxx", "count": 123}, ...]
         """
-        return await self._repo.categories_with_counts()
+        cached = _meta_cache.get("categories")
+        if cached is None:
+            cached = await self._repo.categories_with_counts()
+            _meta_cache.set("categories", cached)
+        return cached
 
     async def get_collection_logs(self, limit: int = 20) -> list[CollectionLog]:
         """
@@ -5,81 +5,281 @@ Stream Service - SSE实时推送服务
 - 管理SSE连接
 - 实时新闻推送
 - 游标管理（增量推送）
+- 由数据库直接生成 JSON 负载，避免逐行 Pydantic 校验与序列化
 
 设计原则：
 - 单一职责：只处理实时流相关逻辑
 - 独立运行：不依赖请求上下文，使用独立数据库会话
+- 扇出广播：每个进程只有一个后台任务查询新文章，查询频率与客户端数量无关
 """
 
 import asyncio
+import logging
 from datetime import datetime
 from typing import AsyncGenerator
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Text, cast, func, select, tuple_
 from sqlalchemy.ext.asyncio import async_sessionmaker
 
 from app.models.news import NewsArticle
+from app.schemas.news import NewsArticleResponse
+
+logger = logging.getLogger(__name__)
+
+# 推送字段与 NewsArticleResponse 保持一致；转为 text 以免驱动把 json 解码成 dict
+_JSON_COLUMN_OVERRIDES = {
+    # bytea 在 JSON 中会输出为 "\\x..."，与 API 一样改为十六进制串
+    "content_hash": func.encode(NewsArticle.content_hash, "hex"),
+}
+_ARTICLE_JSON = cast(
+    func.json_build_object(
+        *(
+            arg
+            for name in NewsArticleResponse.model_fields
+            for arg in (
+                name,
+                _JSON_COLUMN_OVERRIDES.get(name, getattr(NewsArticle, name)),
+            )
+        )
+    ),
+    Text,
+).label("payload")
+
+_Cursor = tuple[datetime, UUID]
+_StreamRow = tuple[datetime, UUID, bytes]
+
+# 订阅队列溢出时放入的标记，客户端据此按自身游标补齐
+_RESYNC = object()
+
+
+async def _fetch_latest(
+    session_maker: async_sessionmaker, batch_size: int
+) -> list[_StreamRow]:
+    """取最近一批文章（按游标升序返回）"""
+    async with session_maker() as db:
+        result = await db.execute(
+            select(NewsArticle.collected_at, NewsArticle.id, _ARTICLE_JSON)
+            .where(NewsArticle.is_filtered == False)
+            .order_by(NewsArticle.collected_at.desc(), NewsArticle.id.desc())
+            .limit(batch_size)
+        )
+        return [
+            (collected_at, article_id, payload.encode())
+            for collected_at, article_id, payload in reversed(result.all())
+        ]
+
+
+async def _fetch_after(
+    session_maker: async_sessionmaker,
+    cursor: _Cursor | None,
+    batch_size: int,
+) -> list[_StreamRow]:
+    """按游标 (collected_at, id) 拉取下一批文章；游标为空时从头开始"""
+    query = select(NewsArticle.collected_at, NewsArticle.id, _ARTICLE_JSON).where(
+        NewsArticle.is_filtered == False
+    )
+    if cursor is not None:
+        query = query.where(
+            tuple_(NewsArticle.collected_at, NewsArticle.id) > tuple_(*cursor)
+        )
+
+    async with session_maker() as db:
+        result = await db.execute(
+            query.order_by(
+                NewsArticle.collected_at.asc(), NewsArticle.id.asc()
+            ).limit(batch_size)
+        )
+        return [
+            (collected_at, article_id, payload.encode())
+            for collected_at, article_id, payload in result.all()
+        ]
+
+
+class StreamBroadcaster:
+    """
+    新文章广播器
+
+    由 NewArticleListener 的通知唤醒，单个后台任务按游标查询新文章，
+    并把同一份序列化结果分发到每个订阅者的有界队列。
+    无通知时每 fallback_interval 秒也补查一次，通知丢失时推送最多延迟这么久。
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker,
+        *,
+        batch_size: int = 20,
+        queue_size: int = 100,
+        retry_delay: float = 5.0,
+        fallback_interval: float = 60.0,
+    ):
+        self._session_maker = session_maker
+        self._batch_size = batch_size
+        self._queue_size = queue_size
+        self._retry_delay = retry_delay
+        self._fallback_interval = fallback_interval
+        self._subscribers: set[asyncio.Queue] = set()
+        self._wakeup = asyncio.Event()
+        self._cursor: _Cursor | None = None
+        self._task: asyncio.Task | None = None
+
+    def notify(self, _payload: str | None = None) -> None:
+        """NOTIFY 回调：唤醒广播任务，突发的多条通知合并为一次查询"""
+        self._wakeup.set()
+
+    def subscribe(self) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self._queue_size)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        self._subscribers.discard(queue)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def _publish(self, row: _StreamRow) -> None:
+        for queue in list(self._subscribers):
+            try:
+                queue.put_nowait(row)
+            except asyncio.QueueFull:
+                # 消费过慢：丢弃积压，改由客户端自行补查
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(_RESYNC)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                latest = await _fetch_latest(self._session_maker, 1)
+                self._cursor = latest[-1][:2] if latest else None
+                break
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Stream broadcaster failed to load cursor: {e}")
+                await asyncio.sleep(self._retry_delay)
+
+        while True:
+            # 兜底：即使通知丢失（监听连接异常而尚未发现），也定期补查一次
+            try:
+                await asyncio.wait_for(
+                    self._wakeup.wait(), timeout=self._fallback_interval
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                while True:
+                    rows = await _fetch_after(
+                        self._session_maker, self._cursor, self._batch_size
+                    )
+                    for row in rows:
+                        self._publish(row)
+                        self._cursor = row[:2]
+                    if len(rows) < self._batch_size:
+                        break
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Stream broadcaster query failed: {e}")
+                await asyncio.sleep(self._retry_delay)
+                self._wakeup.set()
 
 
 class StreamService:
     """SSE流服务"""
 
-    def __init__(self, session_maker: async_sessionmaker):
+    def __init__(
+        self,
+        session_maker: async_sessionmaker,
+        broadcaster: StreamBroadcaster,
+    ):
         """
         初始化流服务
 
         Args:
-            session_maker: 异步会话工厂，用于创建独立的数据库会话
+            session_maker: 异步会话工厂，用于回填与补查
+            broadcaster: 进程内共享的新文章广播器
         """
         self.session_maker = session_maker
+        self.broadcaster = broadcaster
 
     async def news_article_generator(
         self,
-        poll_interval: float = 10.0,
-    ) -> AsyncGenerator[NewsArticle, None]:
+        heartbeat_interval: float = 15.0,
+        batch_size: int = 20,
+        resume_cursor: _Cursor | None = None,
+    ) -> AsyncGenerator[_StreamRow | None, None]:
         """
         生成新闻增量流
 
-        使用游标机制实现增量推送，避免重复发送。
+        连接建立时回填最近一批文章（断线重连时从 resume_cursor 之后补齐），
+        之后从广播器的订阅队列读取新文章；空闲期间不访问数据库。
 
         Args:
-            poll_interval: 轮询间隔（秒）
+            heartbeat_interval: 无新文章时的心跳间隔（秒）
+            batch_size: 回填与补查的单批条数
+            resume_cursor: 客户端最后收到的 (collected_at, id)
 
         Yields:
-            NewsArticle: 增量新闻实体
+            tuple: (collected_at, id, JSON 负载)；None 表示心跳
         """
-        last_id: UUID | None = None
-        last_collected_at: datetime | None = None
-
-        while True:
-            async with self.session_maker() as db:
-                # 构建游标查询
-                query = (
-                    select(NewsArticle)
-                    .where(NewsArticle.is_filtered == False)
-                    .order_by(NewsArticle.collected_at.asc(), NewsArticle.id.asc())
-                    .limit(20)
-                )
+        # 先订阅再回填，回填期间到达的文章按游标去重
+        queue = self.broadcaster.subscribe()
+        try:
+            cursor = resume_cursor
+            if cursor is None:
+                for row in await _fetch_latest(self.session_maker, batch_size):
+                    cursor = row[:2]
+                    yield row
+            else:
+                async for row in self._catch_up(cursor, batch_size):
+                    cursor = row[:2]
+                    yield row
 
-                # 应用游标条件
-                if last_collected_at is not None and last_id is not None:
-                    query = query.where(
-                        (NewsArticle.collected_at > last_collected_at)
-                        | (
-                            (NewsArticle.collected_at == last_collected_at)
-                            & (NewsArticle.id > last_id)
-                        )
+            while True:
+                try:
+                    item = await asyncio.wait_for(
+                        queue.get(), timeout=heartbeat_interval
                     )
+                except asyncio.TimeoutError:
+                    yield None
+                    continue
 
-                result = await db.execute(query)
-                new_articles = result.scalars().all()
+                if item is _RESYNC:
+                    async for row in self._catch_up(cursor, batch_size):
+                        cursor = row[:2]
+                        yield row
+                    continue
 
-                for article in new_articles:
-                    yield article
+                if cursor is not None and item[:2] <= cursor:
+                    continue
+                cursor = item[:2]
+                yield item
+        finally:
+            self.broadcaster.unsubscribe(queue)
 
-                    # 更新游标
-                    last_collected_at = article.collected_at
-                    last_id = article.id
-
-            await asyncio.sleep(poll_interval)
+    async def _catch_up(
+        self, cursor: _Cursor | None, batch_size: int
+    ) -> AsyncGenerator[_StreamRow, None]:
+        """按游标分批补查，直到追上最新文章"""
+        while True:
+            rows = await _fetch_after(self.session_maker, cursor, batch_size)
+            for row in rows:
+                cursor = row[:2]
+                yield row
+            if len(rows) < batch_size:
+                break
@@ -11,7 +11,9 @@ from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sess
 from app.database import Base
 from app.config import settings
 from app.models.news import NewsArticle
+from app.services import dedup
 from app.services.dedup import DeduplicationService
+from app.services.news_dedup.types import NewsText
 
 # Use a separate test database or in-memory sqlite if possible
 # For now, we'll mock the database or use a test engine
@@ -28,6 +30,9 @@ class TestDeduplicationService(unittest.IsolatedAsyncioTestCase):
         self.session = self.session_maker()
         settings.DEDUP_SYNONYM_DATA_DIR = "e:\\project\\news\\backend\\app\\data\\chinese-synonyms-test-missing"
         self.dedup_service = DeduplicationService(self.session)
+        # The known-keys LRU is process-wide; don't let one test's rows leak into another
+        dedup._known_keys.clear()
+        self.addCleanup(dedup._known_keys.clear)
 
     async def asyncTearDown(self):
         await self.session.close()
@@ -57,7 +62,7 @@ class TestDeduplicationService(unittest.IsolatedAsyncioTestCase):
             url=url,
             source="test",
             published_at=datetime.now(timezone.utc),
-            content_hash="hash1"
+            content_hash=b"hash1"
         )
         self.session.add(article)
         await self.session.commit()
@@ -93,7 +98,7 @@ class TestDeduplicationService(unittest.IsolatedAsyncioTestCase):
             url="https://example.com/news/1",
             source="jin10",
             published_at=datetime.now(timezone.utc),
-            content_hash="hash1"
+            content_hash=b"hash1"
         )
         self.session.add(article)
         await self.session.commit()
@@ -117,7 +122,7 @@ class TestDeduplicationService(unittest.IsolatedAsyncioTestCase):
             url="https://example.com/news/10",
             source="jin10",
             published_at=datetime.now(timezone.utc),
-            content_hash="hash10"
+            content_hash=b"hash10"
         )
         self.session.add(article)
         await self.session.commit()
@@ -141,7 +146,7 @@ class TestDeduplicationService(unittest.IsolatedAsyncioTestCase):
                 url="https://example.com/news/20",
                 source="jin10",
                 published_at=datetime.now(timezone.utc),
-                content_hash="hash20",
+                content_hash=b"hash20",
             )
             self.session.add(article)
             await self.session.commit()
@@ -152,6 +157,94 @@ class TestDeduplicationService(unittest.IsolatedAsyncioTestCase):
             )
             self.assertTrue(is_dup)
 
+    async def test_filter_duplicates_within_batch(self):
+        candidates = [
+            ("https://example.com/batch/1", NewsText(title="美联储宣布维持利率不变")),
+            # Same URL as an earlier candidate
+            ("https://example.com/batch/1", NewsText(title="Apple reports record quarterly revenue")),
+            # Same normalized title and source as an earlier candidate
+            ("https://example.com/batch/2", NewsText(title="【快讯】美联储宣布维持利率不变！")),
+        ]
+        results = await self.dedup_service.filter_duplicates(candidates, "jin10")
+
+        first_hash = self.dedup_service.compute_content_hash("美联储宣布维持利率不变", "jin10")
+        self.assertEqual(results[0], (False, first_hash))
+        self.assertEqual(results[1], (True, b""))
+        self.assertEqual(results[2], (True, first_hash))
+
+    async def test_find_existing_url_and_hash_hits(self):
+        stored_hash = self.dedup_service.compute_content_hash("美股全线收高", "jin10")
+        self.session.add(
+            NewsArticle(
+                title="美股全线收高",
+                url="https://example.com/news/30",
+                source="jin10",
+                published_at=datetime.now(timezone.utc),
+                content_hash=stored_hash,
+            )
+        )
+        await self.session.commit()
+
+        other_hash = self.dedup_service.compute_content_hash("Something else", "jin10")
+        urls, hashes = await self.dedup_service.find_existing(
+            ["https://example.com/news/30", "https://example.com/news/31"],
+            [other_hash, stored_hash],
+        )
+        self.assertEqual(urls, {"https://example.com/news/30"})
+        self.assertEqual(hashes, {stored_hash})
+
+        # URL hit reports no hash; hash hit on a new URL reports the matching hash
+        results = await self.dedup_service.filter_duplicates(
+            [
+                ("https://example.com/news/30", NewsText(title="Unrelated headline")),
+                ("https://example.com/news/32", NewsText(title="美股 全线收高!!")),
+            ],
+            "jin10",
+        )
+        self.assertEqual(results, [(True, b""), (True, stored_hash)])
+
+    async def test_known_keys_lru_eviction(self):
+        original_size = settings.DEDUP_KNOWN_CACHE_SIZE
+        self.addCleanup(setattr, settings, "DEDUP_KNOWN_CACHE_SIZE", original_size)
+        settings.DEDUP_KNOWN_CACHE_SIZE = 2
+
+        dedup._remember_known(["a", "b"])
+        dedup._remember_known(["a"])  # refresh "a" so "b" is now the oldest
+        dedup._remember_known(["c"])
+        self.assertEqual(list(dedup._known_keys), ["a", "c"])
+
+        # Cached keys are answered without the database; evicted ones are not
+        urls, _ = await self.dedup_service.find_existing(["a", "b"], [])
+        self.assertEqual(urls, {"a"})
+
+        settings.DEDUP_KNOWN_CACHE_SIZE = 0
+        dedup._remember_known(["d"])
+        self.assertNotIn("d", dedup._known_keys)
+
+    async def test_known_keys_cleared_after_purge(self):
+        url = "https://example.com/purged"
+        article = NewsArticle(
+            title="待清理",
+            url=url,
+            source="test",
+            published_at=datetime.now(timezone.utc),
+            content_hash=b"purged",
+        )
+        self.session.add(article)
+        await self.session.commit()
+        urls, _ = await self.dedup_service.find_existing([url], [])
+        self.assertEqual(urls, {url})
+
+        # Insert notifications (id|collected_at) leave the cache alone
+        dedup.invalidate_known_keys(f"{article.id}|1760000000.0")
+        self.assertIn(url, dedup._known_keys)
+
+        await self.session.delete(article)
+        await self.session.commit()
+        dedup.invalidate_known_keys("deleted")
+        urls, _ = await self.dedup_service.find_existing([url], [])
+        self.assertEqual(urls, set())
+
     async def test_similarity_calculation(self):
         s1 = "abcdef"
         s2 = "abcefg"
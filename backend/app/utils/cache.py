@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import time
+from typing import Any
+
+
+class TTLCache:
+    """进程内带过期时间的简单缓存"""
+
+    def __init__(self, ttl_seconds: float, max_entries: int | None = None):
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._data: dict[str, tuple[float, Any]] = {}
+
+    def get(self, key: str) -> Any | None:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            self._data.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        now = time.monotonic()
+        if (
+            self._max_entries is not None
+            and key not in self._data
+            and len(self._data) >= self._max_entries
+        ):
+            # 先清掉过期项；仍然满则丢弃最早写入的一项
+            self._data = {k: v for k, v in self._data.items() if v[0] > now}
+            if len(self._data) >= self._max_entries:
+                self._data.pop(next(iter(self._data)))
+        self._data[key] = (now + self._ttl, value)
+
+    def clear(self) -> None:
+        self._data.clear()
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, TypeVar
+
+from app.config import settings
+
+T = TypeVar("T")
+
+# 所有采集器共用的阻塞 I/O 线程池（AkShare 等同步库调用）；
+# 线程数有上限，避免每个采集模块各自建池导致空闲线程堆积。
+# HTTP 采集已走 AsyncClient，不占用此池，默认大小可通过配置覆盖
+collector_executor = ThreadPoolExecutor(
+    max_workers=settings.COLLECTOR_EXECUTOR_WORKERS
+    or min(32, (os.cpu_count() or 1) * 4),
+    thread_name_prefix="collector",
+)
+
+
+async def run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """在共享线程池中执行阻塞函数"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(collector_executor, partial(func, *args, **kwargs))
+
+
+def shutdown_executor() -> None:
+    collector_executor.shutdown(wait=False, cancel_futures=True)
@@ -1,11 +1,83 @@
 from __future__ import annotations
 
+import threading
 from typing import Any
 
 import httpx
 
 from app.utils.network import get_httpx_proxy
 
+# 进程级连接池：按代理配置复用 httpx.Client / AsyncClient，跨采集周期保持 TCP/TLS 长连接
+_POOL_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+_clients: dict[str, httpx.Client] = {}
+_clients_lock = threading.Lock()
+# AsyncClient 只在事件循环线程中使用，无需加锁
+_async_clients: dict[str, httpx.AsyncClient] = {}
+
+
+def _proxy_key(proxy: str | dict[str, str] | None) -> str:
+    if isinstance(proxy, dict):
+        return "|".join(f"{k}={v}" for k, v in sorted(proxy.items()))
+    return proxy or ""
+
+
+def _client_kwargs(
+    proxy: str | dict[str, str] | None, transport_cls: type
+) -> dict[str, Any]:
+    kwargs: dict[str, Any] = {"limits": _POOL_LIMITS, "trust_env": False}
+    if isinstance(proxy, dict):
+        kwargs["mounts"] = {
+            pattern: transport_cls(proxy=url, limits=_POOL_LIMITS)
+            for pattern, url in proxy.items()
+        }
+    elif proxy:
+        kwargs["proxy"] = proxy
+    return kwargs
+
+
+def _build_client(proxy: str | dict[str, str] | None) -> httpx.Client:
+    return httpx.Client(**_client_kwargs(proxy, httpx.HTTPTransport))
+
+
+def get_client(proxy: str | dict[str, str] | None = None) -> httpx.Client:
+    """获取（必要时创建）指定代理配置的共享 Client，线程安全"""
+    key = _proxy_key(proxy)
+    client = _clients.get(key)
+    if client is not None:
+        return client
+
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = _clients[key] = _build_client(proxy)
+        return client
+
+
+def get_async_client(proxy: str | dict[str, str] | None = None) -> httpx.AsyncClient:
+    """获取（必要时创建）指定代理配置的共享 AsyncClient"""
+    key = _proxy_key(proxy)
+    client = _async_clients.get(key)
+    if client is None:
+        client = _async_clients[key] = httpx.AsyncClient(
+            **_client_kwargs(proxy, httpx.AsyncHTTPTransport)
+        )
+    return client
+
+
+def close_clients() -> None:
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        client.close()
+
+
+async def close_async_clients() -> None:
+    clients = list(_async_clients.values())
+    _async_clients.clear()
+    for client in clients:
+        await client.aclose()
+
 
 def request(
     method: str,
@@ -20,26 +92,58 @@ def request(
     effective_proxy = proxy if proxy is not None else get_httpx_proxy()
 
     try:
-        return httpx.request(
+        return get_client(effective_proxy).request(
+            method,
+            url,
+            params=params,
+            headers=headers,
+            timeout=timeout,
+            follow_redirects=follow_redirects,
+        )
+    except Exception:
+        if effective_proxy:
+            return get_client(None).request(
+                method,
+                url,
+                params=params,
+                headers=headers,
+                timeout=timeout,
+                follow_redirects=follow_redirects,
+            )
+        raise
+
+
+async def request_async(
+    method: str,
+    url: str,
+    *,
+    params: dict[str, Any] | None = None,
+    headers: dict[str, str] | None = None,
+    timeout: float | None = None,
+    follow_redirects: bool = False,
+    proxy: str | dict[str, str] | None = None,
+) -> httpx.Response:
+    """request() 的异步版本，直接在事件循环中执行，无需线程池"""
+    effective_proxy = proxy if proxy is not None else get_httpx_proxy()
+
+    try:
+        return await get_async_client(effective_proxy).request(
             method,
             url,
             params=params,
             headers=headers,
             timeout=timeout,
             follow_redirects=follow_redirects,
-            trust_env=False,
-            proxy=effective_proxy,
         )
     except Exception:
         if effective_proxy:
-            return httpx.request(
+            return await get_async_client(None).request(
                 method,
                 url,
                 params=params,
                 headers=headers,
                 timeout=timeout,
                 follow_redirects=follow_redirects,
-                trust_env=False,
             )
         raise
 
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+import uuid
+
+# 批量读取随机字节，摊薄 getrandom 系统调用
+_RANDOM_POOL_SIZE = 4096
+_random_pool = b""
+_random_pos = 0
+_random_lock = threading.Lock()
+
+
+def _random_bytes(n: int) -> bytes:
+    global _random_pool, _random_pos
+
+    with _random_lock:
+        if _random_pos + n > len(_random_pool):
+            _random_pool = os.urandom(_RANDOM_POOL_SIZE)
+            _random_pos = 0
+        chunk = _random_pool[_random_pos : _random_pos + n]
+        _random_pos += n
+        return chunk
+
+
+def uuid7() -> uuid.UUID:
+    """生成按时间递增的 UUIDv7（RFC 9562），新行总是落在 btree 最右侧叶子页"""
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(_random_bytes(10), "big")
+
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76  # version
+    value |= (rand >> 68) << 64  # rand_a: 12 bits
+    value |= 0b10 << 62  # variant
+    value |= rand & 0x3FFF_FFFF_FFFF_FFFF  # rand_b: 62 bits
+    return uuid.UUID(int=value)
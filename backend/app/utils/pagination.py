@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import base64
+from datetime import datetime
+from uuid import UUID
+
+
+def encode_cursor(published_at: datetime, article_id: UUID) -> str:
+    """将 (published_at, id) 编码为不透明的 base64url 游标"""
+    raw = f"{published_at.isoformat()}|{article_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """解析游标，格式非法时抛出 ValueError"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        published_at_str, _, article_id_str = raw.partition("|")
+        return datetime.fromisoformat(published_at_str), UUID(article_id_str)
+    except (TypeError, ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
@@ -0,0 +1,38 @@
+import time
+import unittest
+from unittest import mock
+
+from app.utils.ids import uuid7
+
+
+class TestUuid7(unittest.TestCase):
+    def test_version_and_variant(self):
+        value = uuid7()
+        self.assertEqual(value.version, 7)
+        self.assertEqual(value.variant, "specified in RFC 4122")
+
+    def test_embeds_millisecond_timestamp(self):
+        before = time.time_ns() // 1_000_000
+        value = uuid7()
+        after = time.time_ns() // 1_000_000
+        self.assertTrue(before <= value.int >> 80 <= after)
+
+    def test_ordered_by_generation_time(self):
+        # Each id in a later millisecond sorts after every earlier one, both as
+        # UUIDs and as the bytes PostgreSQL compares
+        ids = []
+        for ms in range(1_700_000_000_000, 1_700_000_000_050):
+            with mock.patch("app.utils.ids.time.time_ns", return_value=ms * 1_000_000):
+                ids.append(uuid7())
+        self.assertEqual(ids, sorted(ids))
+        self.assertEqual(ids, sorted(ids, key=lambda u: u.bytes))
+
+    def test_unique_within_one_millisecond(self):
+        with mock.patch("app.utils.ids.time.time_ns", return_value=1_700_000_000_000_000_000):
+            ids = [uuid7() for _ in range(1000)]
+        self.assertEqual(len(set(ids)), len(ids))
+        self.assertTrue(all(u.int >> 80 == 1_700_000_000_000 for u in ids))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import base64
+import unittest
+from datetime import datetime, timedelta, timezone
+from uuid import UUID, uuid4
+
+from app.utils.pagination import decode_cursor, encode_cursor
+
+
+class TestCursor(unittest.TestCase):
+    def test_round_trip(self):
+        article_id = uuid4()
+        for published_at in (
+            datetime(2026, 10, 15, 12, 30, 45, 123456, tzinfo=timezone.utc),
+            datetime(2026, 10, 15, 20, 0, tzinfo=timezone(timedelta(hours=8))),
+            datetime(2026, 1, 1),
+        ):
+            with self.subTest(published_at=published_at):
+                cursor = encode_cursor(published_at, article_id)
+                self.assertNotIn("=", cursor)
+                decoded_at, decoded_id = decode_cursor(cursor)
+                self.assertEqual(decoded_at, published_at)
+                self.assertEqual(decoded_at.utcoffset(), published_at.utcoffset())
+                self.assertEqual(decoded_id, article_id)
+
+    def test_cursor_is_url_safe(self):
+        cursor = encode_cursor(
+            datetime(2026, 10, 15, tzinfo=timezone.utc),
+            UUID("ffffffff-ffff-ffff-ffff-ffffffffffff"),
+        )
+        self.assertTrue(all(c.isalnum() or c in "-_" for c in cursor))
+
+    def test_invalid_cursor_raises_value_error(self):
+        def b64(raw: bytes) -> str:
+            return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+        invalid = {
+            "empty": "",
+            "not base64": "!!!***",
+            "bad padding length": "a",
+            "not utf-8": b64(b"\xff\xfe\xfd"),
+            "no separator": b64(b"2026-10-15T00:00:00+00:00"),
+            "bad datetime": b64(f"yesterday|{uuid4()}".encode()),
+            "bad uuid": b64(b"2026-10-15T00:00:00+00:00|not-a-uuid"),
+        }
+        for description, cursor in invalid.items():
+            with self.subTest(description):
+                with self.assertRaises(ValueError):
+                    decode_cursor(cursor)
+
+
+if __name__ == "__main__":
+    unittest.main()
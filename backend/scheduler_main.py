@@ -13,6 +13,8 @@ import sys
 from app.config import settings
 from app.database import init_db
 from app.services.scheduler import start_scheduler, stop_scheduler
+from app.utils.executor import shutdown_executor
+from app.utils.http_client import close_async_clients, close_clients
 
 # Configure logging
 logging.basicConfig(
@@ -54,6 +56,9 @@ async def main():
         # Cleanup
         logger.info("Stopping scheduler...")
         stop_scheduler()
+        close_clients()
+        await close_async_clients()
+        shutdown_executor()
         logger.info("Scheduler stopped. Exiting.")
 
 
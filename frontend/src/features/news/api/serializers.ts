@@ -11,7 +11,7 @@ export function mapArticleDtoToArticle(dto: ArticleDTO): Article {
   return {
     id: dto.id,
     title: dto.title,
-    content: dto.content,
+    content: dto.content ?? null,
     summary: dto.summary,
     url: dto.url,
     source: dto.source,
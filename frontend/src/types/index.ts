@@ -33,7 +33,8 @@ export interface ArticleUpdate {
 export interface ArticleDTO {
   id: string
   title: string
-  content: string | null
+  // 列表接口不返回正文，仅单篇文章接口返回
+  content?: string | null
   summary: string | null
   url: string
   source: string